@@ -44,7 +44,7 @@ class LoginResponse:
     token_type: str = "Bearer"
 
 
-@dataclass
+@dataclass(slots=True)
 class RefreshRequest:
     """Input DTO for token refresh."""
 
@@ -290,7 +290,7 @@ class StorefrontProductDTO:
 # Image upload requests
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadProductImageRequest:
     """Request to upload product image."""
 
@@ -303,7 +303,7 @@ class UploadProductImageRequest:
     uploaded_by: Optional[UUID] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadVariantImageRequest:
     """Request to upload variant image."""
 
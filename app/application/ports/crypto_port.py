@@ -1,5 +1,6 @@
 """Cryptography ports for password and token hashing."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -16,6 +17,14 @@ class PasswordHasherPort(ABC):
         """Verify password against hash."""
         ...
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password on a worker thread so the event loop is not blocked."""
+        return await asyncio.to_thread(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify password against hash on a worker thread."""
+        return await asyncio.to_thread(self.verify_password, password, password_hash)
+
 
 class TokenHasherPort(ABC):
     """Port interface for refresh token generation and hashing."""
@@ -45,13 +45,15 @@ class ChangePasswordUseCase:
                 raise UserNotFoundError(f"User {request.user_id} not found")
 
             # Verify old password
-            if not self.password_hasher.verify_password(
+            if not await self.password_hasher.verify_password_async(
                 request.old_password, user.password_hash
             ):
                 raise InvalidCredentialsError("Current password is incorrect")
 
             # Hash new password
-            new_password_hash = self.password_hasher.hash_password(request.new_password)
+            new_password_hash = await self.password_hasher.hash_password_async(
+                request.new_password
+            )
 
             # Update user with new password (increments token_version)
             now = self.clock.now()
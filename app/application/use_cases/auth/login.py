@@ -58,7 +58,9 @@ class LoginUseCase:
                 raise InvalidCredentialsError("Invalid email or password")
 
             # Verify password
-            if not self.password_hasher.verify_password(request.password, user.password_hash):
+            if not await self.password_hasher.verify_password_async(
+                request.password, user.password_hash
+            ):
                 # Audit failed login
                 await self.audit_log.log_event(
                     event_type="user.login_failed",
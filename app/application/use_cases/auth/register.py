@@ -49,7 +49,7 @@ class RegisterUseCase:
                 raise UserAlreadyExistsError(f"User with email {email} already exists")
 
             # Hash password
-            password_hash = self.password_hasher.hash_password(request.password)
+            password_hash = await self.password_hasher.hash_password_async(request.password)
 
             # Create user entity
             now = self.clock.now()
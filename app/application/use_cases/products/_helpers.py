@@ -0,0 +1,47 @@
+"""Shared builders for new products (internal, not a public use case)."""
+
+import uuid
+from datetime import datetime
+
+from app.application.dto.product_dto import CreateProductRequest, ProductDTO
+from app.domain.entities.product import Product, ProductStatus
+from app.domain.value_objects.slug import Slug
+
+
+def new_product(request: CreateProductRequest, now: datetime) -> Product:
+    """Build a draft Product entity from a create request."""
+    product_id = uuid.uuid4()
+    return Product(
+        id=product_id,
+        status=ProductStatus.DRAFT,
+        name=request.name,
+        slug=Slug.from_string_and_id(request.name, product_id),
+        description_short=request.description_short,
+        description_long=request.description_long,
+        tags=request.tags,
+        featured=request.featured,
+        sort_order=request.sort_order,
+        created_at=now,
+        updated_at=now,
+        created_by=request.created_by,
+        updated_by=request.created_by,
+    )
+
+
+def build_product_dto(product: Product) -> ProductDTO:
+    """Build a ProductDTO from a Product entity."""
+    return ProductDTO(
+        id=product.id,
+        status=product.status.value,
+        name=product.name,
+        slug=str(product.slug),
+        description_short=product.description_short,
+        description_long=product.description_long,
+        tags=product.tags,
+        featured=product.featured,
+        sort_order=product.sort_order,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+        created_by=product.created_by,
+        updated_by=product.updated_by,
+    )
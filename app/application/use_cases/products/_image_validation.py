@@ -0,0 +1,75 @@
+"""Image byte validation shared by the image upload use cases (internal, not a use case)."""
+
+import io
+from collections.abc import Collection
+from typing import Optional
+
+# The plugins are imported to register the sniffed formats up front; Image.open
+# only loads the WebP plugin lazily, after probing every preloaded one
+from PIL import (  # noqa: F401
+    Image,
+    JpegImagePlugin,
+    PngImagePlugin,
+    UnidentifiedImageError,
+    WebPImagePlugin,
+)
+
+from app.application.errors.app_errors import ImageProcessingError
+
+# Leading magic bytes of the formats recognised without asking Pillow
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+
+def _sniff_format(file_data: bytes) -> Optional[str]:
+    """Return the format named by the magic bytes of ``file_data``, if any."""
+    for signature, format_name in _SIGNATURES:
+        if file_data.startswith(signature):
+            return format_name
+    # RIFF container: the form type follows the 4-byte chunk size
+    if file_data[:4] == b"RIFF" and file_data[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _unsupported(
+    format_name: Optional[str], allowed_formats: Collection[str]
+) -> ImageProcessingError:
+    allowed = ", ".join(sorted(allowed_formats)).upper()
+    return ImageProcessingError(f"Unsupported image format: {format_name}. Allowed: {allowed}")
+
+
+def validate_image_format(file_data: bytes, allowed_formats: Collection[str]) -> str:
+    """
+    Validate image bytes and return the detected format (lowercase).
+
+    Payloads whose magic bytes match no known format, or a format outside
+    ``allowed_formats``, are rejected without involving Pillow; the rest are
+    opened with only the matching Pillow plugin (instead of probing all of
+    them) so the header itself is validated.
+
+    Raises:
+        ImageProcessingError: If invalid/corrupted or unsupported format
+    """
+    sniffed_format = _sniff_format(file_data)
+    if sniffed_format is None:
+        raise ImageProcessingError("Invalid or corrupted image file")
+    if sniffed_format not in allowed_formats:
+        raise _unsupported(sniffed_format, allowed_formats)
+
+    try:
+        img = Image.open(io.BytesIO(file_data), formats=(sniffed_format.upper(),))
+    except UnidentifiedImageError:
+        raise ImageProcessingError("Invalid or corrupted image file") from None
+    except Exception as e:
+        raise ImageProcessingError(f"Failed to process image: {str(e)}") from e
+
+    # The JPEG plugin may still hand back a different format (e.g. MPO)
+    detected_format = img.format.lower() if img.format else None
+    if detected_format != sniffed_format:
+        raise _unsupported(detected_format, allowed_formats)
+    return sniffed_format
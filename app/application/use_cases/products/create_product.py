@@ -1,13 +1,10 @@
 """Create product use case."""
 
-import uuid
-
 from app.application.dto.product_dto import CreateProductRequest, ProductDTO
 from app.application.interfaces.uow import UnitOfWork
 from app.application.ports.audit_log_port import AuditLogPort
 from app.application.ports.clock_port import ClockPort
-from app.domain.entities.product import Product, ProductStatus
-from app.domain.value_objects.slug import Slug
+from app.application.use_cases.products._helpers import build_product_dto, new_product
 
 
 class CreateProductUseCase:
@@ -27,28 +24,10 @@ class CreateProductUseCase:
         """
         Create new product.
         """
-        product_id = uuid.uuid4()
-        slug = Slug.from_string_and_id(request.name, product_id)
-
         async with self.uow:
 
             # Create product entity
-            now = self.clock.now()
-            product = Product(
-                id=product_id,
-                status=ProductStatus.DRAFT,
-                name=request.name,
-                slug=slug,
-                description_short=request.description_short,
-                description_long=request.description_long,
-                tags=request.tags,
-                featured=request.featured,
-                sort_order=request.sort_order,
-                created_at=now,
-                updated_at=now,
-                created_by=request.created_by,
-                updated_by=request.created_by,
-            )
+            product = new_product(request, self.clock.now())
 
             # Save product
             product = await self.uow.products.save(product)
@@ -65,18 +44,4 @@ class CreateProductUseCase:
                 },
             )
 
-            return ProductDTO(
-                id=product.id,
-                status=product.status.value,
-                name=product.name,
-                slug=str(product.slug),
-                description_short=product.description_short,
-                description_long=product.description_long,
-                tags=product.tags,
-                featured=product.featured,
-                sort_order=product.sort_order,
-                created_at=product.created_at,
-                updated_at=product.updated_at,
-                created_by=product.created_by,
-                updated_by=product.updated_by,
-            )
+            return build_product_dto(product)
@@ -0,0 +1,49 @@
+"""Batch create products use case."""
+
+from app.application.dto.product_dto import CreateProductRequest, ProductDTO
+from app.application.interfaces.uow import UnitOfWork
+from app.application.ports.audit_log_port import AuditLogPort
+from app.application.ports.clock_port import ClockPort
+from app.application.use_cases.products._helpers import build_product_dto, new_product
+
+
+class CreateProductsBatchUseCase:
+    """Use case for creating several products in one transaction."""
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        clock: ClockPort,
+        audit_log: AuditLogPort,
+    ) -> None:
+        self.uow = uow
+        self.clock = clock
+        self.audit_log = audit_log
+
+    async def execute(self, requests: list[CreateProductRequest]) -> list[ProductDTO]:
+        """
+        Create new products.
+
+        All products are inserted with a single statement and committed
+        together: either every product is created or none is.
+        """
+        now = self.clock.now()
+        products = [new_product(request, now) for request in requests]
+
+        async with self.uow:
+            products = await self.uow.products.save_many(products)
+            await self.uow.commit()
+
+            # Audit log
+            for product in products:
+                await self.audit_log.log_event(
+                    event_type="product.created",
+                    user_id=product.created_by,
+                    details={
+                        "product_id": str(product.id),
+                        "name": product.name,
+                        "slug": str(product.slug),
+                    },
+                )
+
+            return [build_product_dto(product) for product in products]
@@ -1,13 +1,9 @@
 """Upload product image use case."""
 
-import io
 import uuid
 
-from PIL import Image, UnidentifiedImageError
-
 from app.application.dto.product_dto import ProductImageDTO, UploadProductImageRequest
 from app.application.errors.app_errors import (
-    ImageProcessingError,
     ImageUploadError,
     ResourceNotFoundError,
     ValidationError,
@@ -17,6 +13,7 @@ from app.application.ports.audit_log_port import AuditLogPort
 from app.application.ports.cache_port import CachePort
 from app.application.ports.clock_port import ClockPort
 from app.application.ports.file_storage_port import FileStoragePort
+from app.application.use_cases.products._image_validation import validate_image_format
 from app.domain.entities.product_image import ProductImage
 from app.domain.errors.domain_errors import InvalidImageFormatError, ImageTooLargeError
 
@@ -27,6 +24,7 @@ class UploadProductImageUseCase:
     # Allowed MIME types
     ALLOWED_MIME_TYPES = {"image/jpeg", "image/png", "image/webp"}
     ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+    ALLOWED_FORMATS = {"jpeg", "png", "webp"}
 
     def __init__(
         self,
@@ -76,18 +74,8 @@ class UploadProductImageUseCase:
             max_mb = self.max_image_bytes / (1024 * 1024)
             raise ValidationError(f"Image size exceeds maximum of {max_mb:.1f}MB")
 
-        # Validate image bytes using Pillow (checks magic bytes and format)
-        try:
-            img = Image.open(io.BytesIO(request.file_data))
-            detected_format = img.format.lower() if img.format else None
-            if detected_format not in {"jpeg", "png", "webp"}:
-                raise ImageProcessingError(
-                    f"Unsupported image format: {detected_format}. Allowed: JPEG, PNG, WEBP"
-                )
-        except UnidentifiedImageError:
-            raise ImageProcessingError("Invalid or corrupted image file")
-        except Exception as e:
-            raise ImageProcessingError(f"Failed to process image: {str(e)}")
+        # Validate image bytes (magic bytes, then the header via Pillow)
+        validate_image_format(request.file_data, self.ALLOWED_FORMATS)
 
         async with self.uow:
             # Check product exists
@@ -19,9 +19,13 @@ class InventoryPolicy:
         if delta == 0:
             raise InvalidStockAdjustmentError("Stock adjustment delta cannot be zero")
 
+        # Restocking and backorderable variants can never go invalid
+        if delta > 0 or inventory.allow_backorder:
+            return
+
         new_on_hand = inventory.on_hand + delta
 
-        if new_on_hand < 0 and not inventory.allow_backorder:
+        if new_on_hand < 0:
             raise InsufficientStockError(
                 f"Cannot adjust stock by {delta}. "
                 f"Would result in {new_on_hand} (backorder not allowed). "
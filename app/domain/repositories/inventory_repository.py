@@ -30,6 +30,11 @@ class InventoryRepository(ABC):
         """Save new inventory record."""
         ...
 
+    @abstractmethod
+    async def save_many(self, inventories: list[Inventory]) -> list[Inventory]:
+        """Save several new inventory records in one statement."""
+        ...
+
     @abstractmethod
     async def update(self, inventory: Inventory) -> Inventory:
         """Update existing inventory."""
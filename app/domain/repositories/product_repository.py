@@ -34,6 +34,11 @@ class ProductRepository(ABC):
         """Save new product."""
         ...
 
+    @abstractmethod
+    async def save_many(self, products: list[Product]) -> list[Product]:
+        """Save several new products in one statement."""
+        ...
+
     @abstractmethod
     async def update(self, product: Product) -> Product:
         """Update existing product."""
@@ -86,6 +91,11 @@ class ProductRepository(ABC):
         """Save new variant."""
         ...
 
+    @abstractmethod
+    async def save_variants(self, variants: list[ProductVariant]) -> list[ProductVariant]:
+        """Save several new variants in one statement."""
+        ...
+
     @abstractmethod
     async def update_variant(self, variant: ProductVariant) -> ProductVariant:
         """Update existing variant."""
@@ -3,6 +3,9 @@
 import re
 from dataclasses import dataclass
 
+# Basic email validation (domain-level, not comprehensive)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z")
+
 
 @dataclass(frozen=True)
 class Email:
@@ -15,9 +18,7 @@ class Email:
         if not self.value or not self.value.strip():
             raise ValueError("Email cannot be empty")
         
-        # Basic email validation (domain-level, not comprehensive)
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, self.value):
+        if not _EMAIL_RE.match(self.value):
             raise ValueError("Invalid email format")
         
         if len(self.value) > 255:
@@ -1,8 +1,12 @@
 """SKU value object."""
 
-import re
+import string
 from dataclasses import dataclass
 
+# SKU should be alphanumeric with hyphens/underscores; the class is ASCII-only,
+# so deleting the allowed characters leaves exactly the offending ones
+_SKU_ALLOWED = str.maketrans("", "", string.ascii_uppercase + string.digits + "_-")
+
 
 @dataclass(frozen=True)
 class SKU:
@@ -16,8 +20,7 @@ class SKU:
             raise ValueError("SKU cannot be empty")
         if len(self.value) > 100:
             raise ValueError("SKU cannot exceed 100 characters")
-        # SKU should be alphanumeric with hyphens/underscores
-        if not re.match(r"^[A-Z0-9_-]+$", self.value):
+        if self.value.translate(_SKU_ALLOWED):
             raise ValueError(
                 "SKU must contain only uppercase alphanumeric characters, "
                 "hyphens, and underscores"
@@ -4,6 +4,12 @@ import re
 from dataclasses import dataclass
 from uuid import UUID
 
+# Slug must be lowercase alphanumeric with hyphens
+_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*\Z")
+_INVALID_CHARS_RE = re.compile(r"[^\w\s-]")
+_SEPARATORS_RE = re.compile(r"[-\s]+")
+
+
 @dataclass(frozen=True)
 class Slug:
     """Slug value object for URL-friendly identifiers."""
@@ -16,8 +22,7 @@ class Slug:
             raise ValueError("Slug cannot be empty")
         if len(self.value) > 200:
             raise ValueError("Slug cannot exceed 200 characters")
-        # Slug must be lowercase alphanumeric with hyphens
-        if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", self.value):
+        if not _SLUG_RE.match(self.value):
             raise ValueError(
                 "Slug must be lowercase alphanumeric with hyphens, "
                 "no leading/trailing hyphens or consecutive hyphens"
@@ -32,8 +37,8 @@ class Slug:
         """
         # Convert to lowercase and replace spaces with hyphens
         slug = text.lower().strip()
-        slug = re.sub(r"[^\w\s-]", "", slug)  # Remove invalid chars
-        slug = re.sub(r"[-\s]+", "-", slug)  # Replace spaces/hyphens with single hyphen
+        slug = _INVALID_CHARS_RE.sub("", slug)  # Remove invalid chars
+        slug = _SEPARATORS_RE.sub("-", slug)  # Replace spaces/hyphens with single hyphen
         slug = slug.strip("-")  # Remove leading/trailing hyphens
 
         if not slug:
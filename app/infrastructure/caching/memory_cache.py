@@ -1,69 +1,157 @@
 """In-memory cache implementation."""
 
 import fnmatch
-from datetime import datetime, timedelta
+import functools
+import heapq
+import re
+from collections.abc import Callable
+from time import monotonic_ns
 from typing import Any, Optional
 
+from app.application.ports.cache_port import CachePort
+
+_NS_PER_SECOND = 1_000_000_000
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=256)
+def _key_matcher(pattern: str) -> Callable[[str], Any]:
+    """
+    Return a predicate for keys matching the glob ``pattern``.
+
+    Patterns without wildcards compare for equality and ``"prefix:*"`` patterns
+    (the usual invalidation shape) use ``str.startswith``; only the rest pay for
+    a regular expression. Invalidations repeat the same few patterns, so the
+    predicates are cached.
+    """
+    if _GLOB_CHARS.isdisjoint(pattern):
+        return pattern.__eq__
+    prefix = pattern[:-1]
+    if pattern.endswith("*") and _GLOB_CHARS.isdisjoint(prefix):
+        return lambda key: key.startswith(prefix)
+    return re.compile(fnmatch.translate(pattern)).match
+
 
 class MemoryCache:
     """
     Simple in-memory cache with TTL support.
     
+    Every operation is a plain dict update, so the API is synchronous; the
+    application talks to it through ``AsyncMemoryCache``.
+    
     WARNING: This is a per-instance cache. In multi-instance deployments,
     consider using Redis or similar distributed cache.
     """
 
-    def __init__(self) -> None:
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+    def __init__(self, clock: Callable[[], int] = monotonic_ns) -> None:
+        # Monotonic time source in nanoseconds; injectable for tests
+        self._clock = clock
+        # key -> (value, expiry as a clock() reading)
+        self._cache: dict[str, tuple[Any, int]] = {}
+        # Min-heap of (expiry, key); entries for overwritten or deleted keys
+        # are left in place and skipped when popped, until they outnumber the
+        # live ones and the heap is rebuilt
+        self._expiry: list[tuple[int, str]] = []
 
-    async def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         if key not in self._cache:
             return None
 
         value, expires_at = self._cache[key]
-        if datetime.utcnow() >= expires_at:
+        if self._clock() >= expires_at:
             # Expired
             del self._cache[key]
             return None
 
         return value
 
-    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
         """Set value in cache with TTL."""
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+        now = self._clock()
+        self._purge_expired(now)
+        expires_at = now + ttl_seconds * _NS_PER_SECOND
         self._cache[key] = (value, expires_at)
+        heapq.heappush(self._expiry, (expires_at, key))
+        self._compact_if_sparse()
 
-    async def delete(self, key: str) -> None:
+    def delete(self, key: str) -> None:
         """Delete key from cache."""
         self._cache.pop(key, None)
+        self._compact_if_sparse()
 
-    async def clear(self) -> None:
+    def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry.clear()
 
-    async def delete_pattern(self, pattern: str) -> None:
+    def delete_pattern(self, pattern: str) -> None:
         """
         Delete all keys matching the given glob pattern.
         
-        Also purges any expired keys encountered during the scan.
+        Also purges every expired key, whether or not it matches.
         
         Args:
             pattern: Glob pattern to match keys (e.g., "products:*", "user:123:*")
                     Supports * (any chars), ? (single char), [seq], [!seq]
         """
-        now = datetime.utcnow()
-        keys_to_delete = []
-        
-        # Scan all keys and collect matches and expired keys
-        for key, (value, expires_at) in list(self._cache.items()):
-            # Remove expired keys
-            if now >= expires_at:
-                keys_to_delete.append(key)
-            # Match pattern on non-expired keys
-            elif fnmatch.fnmatch(key, pattern):
-                keys_to_delete.append(key)
-        
-        # Delete collected keys
-        for key in keys_to_delete:
-            self._cache.pop(key, None)
+        self._purge_expired(self._clock())
+
+        if _GLOB_CHARS.isdisjoint(pattern):
+            self._cache.pop(pattern, None)
+        else:
+            matches = _key_matcher(pattern)
+            for key in [key for key in self._cache if matches(key)]:
+                del self._cache[key]
+        self._compact_if_sparse()
+
+    def _purge_expired(self, now: int) -> None:
+        """Drop entries whose expiry is at or before ``now``, soonest first."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self._cache.get(key)
+            # Skip heap entries superseded by a later set() of the same key
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+
+    def _compact_if_sparse(self) -> None:
+        """
+        Rebuild the expiry heap from the live entries if stale ones outnumber them.
+
+        Called after every write and delete, so the heap stays within twice the
+        cache size and each rebuild is amortised over the calls that made it
+        necessary.
+        """
+        if len(self._expiry) <= 2 * len(self._cache):
+            return
+        self._expiry = [(expires_at, key) for key, (_, expires_at) in self._cache.items()]
+        heapq.heapify(self._expiry)
+
+
+class AsyncMemoryCache(CachePort):
+    """``CachePort`` adapter over a synchronous ``MemoryCache``."""
+
+    def __init__(self, cache: MemoryCache) -> None:
+        self._cache = cache
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Set value in cache with TTL."""
+        self._cache.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        """Delete key from cache."""
+        self._cache.delete(key)
+
+    async def clear(self) -> None:
+        """Clear all cache entries."""
+        self._cache.clear()
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """Delete all keys matching the given glob pattern."""
+        self._cache.delete_pattern(pattern)
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,7 +22,10 @@ class ProductModel(Base):
     slug: Mapped[str] = mapped_column(String(200), nullable=False, unique=True, index=True)
     description_short: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     description_long: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    tags: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+    # Plain JSON on SQLite (test backend), which cannot render JSONB
+    tags: Mapped[list[str]] = mapped_column(
+        JSONB().with_variant(JSON(), "sqlite"), nullable=False, default=list
+    )
     featured: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
@@ -27,6 +27,16 @@ class InventoryMapper:
             allow_backorder=entity.allow_backorder,
         )
 
+    @staticmethod
+    def to_row(entity: Inventory) -> dict:
+        """Convert domain entity to a column mapping for Core inserts."""
+        return {
+            "variant_id": entity.variant_id,
+            "on_hand": entity.on_hand,
+            "reserved": entity.reserved,
+            "allow_backorder": entity.allow_backorder,
+        }
+
     @staticmethod
     def update_model(model: InventoryModel, entity: Inventory) -> None:
         """Update existing ORM model from domain entity."""
@@ -46,6 +46,25 @@ class ProductMapper:
             updated_by=entity.updated_by,
         )
 
+    @staticmethod
+    def to_row(entity: Product) -> dict:
+        """Convert domain entity to a column mapping for Core inserts."""
+        return {
+            "id": entity.id,
+            "status": entity.status.value,
+            "name": entity.name,
+            "slug": str(entity.slug),
+            "description_short": entity.description_short,
+            "description_long": entity.description_long,
+            "tags": entity.tags,
+            "featured": entity.featured,
+            "sort_order": entity.sort_order,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+            "created_by": entity.created_by,
+            "updated_by": entity.updated_by,
+        }
+
     @staticmethod
     def update_model(model: ProductModel, entity: Product) -> None:
         """Update existing ORM model from domain entity."""
@@ -66,6 +66,32 @@ class VariantMapper:
             updated_at=entity.updated_at,
         )
 
+    @staticmethod
+    def to_row(entity: ProductVariant) -> dict:
+        """Convert domain entity to a column mapping for Core inserts."""
+        return {
+            "id": entity.id,
+            "product_id": entity.product_id,
+            "sku": str(entity.sku),
+            "barcode": entity.barcode,
+            "status": entity.status.value,
+            "price_amount": entity.price.amount,
+            "price_currency": entity.price.currency,
+            "compare_at_price_amount": (
+                entity.compare_at_price.amount if entity.compare_at_price else None
+            ),
+            "compare_at_price_currency": (
+                entity.compare_at_price.currency if entity.compare_at_price else None
+            ),
+            "cost_amount": entity.cost.amount if entity.cost else None,
+            "cost_currency": entity.cost.currency if entity.cost else None,
+            "color_id": entity.color_id,
+            "size_id": entity.size_id,
+            "is_default": entity.is_default,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
     @staticmethod
     def update_model(model: ProductVariantModel, entity: ProductVariant) -> None:
         """Update existing ORM model from domain entity."""
@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.inventory import Inventory
@@ -50,6 +50,17 @@ class SqlAlchemyInventoryRepository(InventoryRepository):
         await self.session.flush()
         return InventoryMapper.to_entity(model)
 
+    async def save_many(self, inventories: list[Inventory]) -> list[Inventory]:
+        """Save several new inventory records in one multi-row INSERT."""
+        if not inventories:
+            return []
+        await self.session.execute(
+            insert(InventoryModel).values(
+                [InventoryMapper.to_row(inventory) for inventory in inventories]
+            )
+        )
+        return list(inventories)
+
     async def update(self, inventory: Inventory) -> Inventory:
         """Update existing inventory."""
         stmt = select(InventoryModel).where(InventoryModel.variant_id == inventory.variant_id)
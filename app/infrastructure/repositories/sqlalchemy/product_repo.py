@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import delete, func, or_, select, and_
+from sqlalchemy import delete, func, insert, or_, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -65,6 +65,16 @@ class SqlAlchemyProductRepository(ProductRepository):
         model = result.scalar_one()
         return ProductMapper.to_entity(model)
 
+    async def save_many(self, products: list[Product]) -> list[Product]:
+        """Save several new products in one multi-row INSERT."""
+        if not products:
+            return []
+        # Every column value is set client-side, so there is nothing to read back
+        await self.session.execute(
+            insert(ProductModel).values([ProductMapper.to_row(product) for product in products])
+        )
+        return list(products)
+
     async def update(self, product: Product) -> Product:
         """Update existing product."""
         stmt = select(ProductModel).where(ProductModel.id == product.id)
@@ -174,6 +184,15 @@ class SqlAlchemyProductRepository(ProductRepository):
         await self.session.flush()
         return VariantMapper.to_entity(model)
 
+    async def save_variants(self, variants: list[ProductVariant]) -> list[ProductVariant]:
+        """Save several new variants in one multi-row INSERT."""
+        if not variants:
+            return []
+        await self.session.execute(
+            insert(ProductVariantModel).values([VariantMapper.to_row(variant) for variant in variants])
+        )
+        return list(variants)
+
     async def update_variant(self, variant: ProductVariant) -> ProductVariant:
         """Update existing variant."""
         stmt = select(ProductVariantModel).where(ProductVariantModel.id == variant.id)
@@ -27,6 +27,11 @@ class JwtService(JwtPort):
         self.private_key = private_key
         self.public_key = public_key
         self.algorithm = algorithm
+        # Parse the PEM keys once; PyJWT would otherwise re-parse them on every
+        # encode/decode, which dominates the cost of signing and verifying
+        signing_algorithm = jwt.get_algorithm_by_name(algorithm)
+        self._signing_key = signing_algorithm.prepare_key(private_key)
+        self._verifying_key = signing_algorithm.prepare_key(public_key)
         self.issuer = issuer
         self.audience = audience
         self.kid = kid
@@ -56,14 +61,14 @@ class JwtService(JwtPort):
         headers = {"kid": self.kid}
 
         return jwt.encode(
-            claims, self.private_key, algorithm=self.algorithm, headers=headers
+            claims, self._signing_key, algorithm=self.algorithm, headers=headers
         )
 
     def verify_access_token(self, token: str) -> dict[str, Any]:
         """Verify and decode access token."""
         return jwt.decode(
             token,
-            self.public_key,
+            self._verifying_key,
             algorithms=[self.algorithm],
             issuer=self.issuer,
             audience=self.audience,
@@ -1,6 +1,6 @@
 """Password hasher implementation using argon2."""
 
-from argon2 import PasswordHasher
+from argon2 import Parameters, PasswordHasher, profiles
 from argon2.exceptions import VerifyMismatchError
 
 from app.application.ports.crypto_port import PasswordHasherPort
@@ -9,8 +9,17 @@ from app.application.ports.crypto_port import PasswordHasherPort
 class Argon2PasswordHasher(PasswordHasherPort):
     """Password hasher using Argon2id."""
 
-    def __init__(self) -> None:
-        self.hasher = PasswordHasher()
+    def __init__(self, parameters: Parameters | None = None) -> None:
+        # Default (RFC 9106 low-memory) cost unless explicit parameters are given
+        self.hasher = PasswordHasher.from_parameters(parameters) if parameters else PasswordHasher()
+
+    @classmethod
+    def from_profile(cls, name: str) -> "Argon2PasswordHasher":
+        """Create hasher from an ``argon2.profiles`` name (e.g. ``RFC_9106_LOW_MEMORY``)."""
+        parameters = getattr(profiles, name, None)
+        if not isinstance(parameters, Parameters):
+            raise ValueError(f"Unknown Argon2 profile: {name}")
+        return cls(parameters)
 
     def hash_password(self, password: str) -> str:
         """Hash a password securely using Argon2."""
@@ -35,6 +35,8 @@ from app.application.use_cases.rbac.create_permission import CreatePermissionUse
 from app.application.use_cases.rbac.delete_permission import DeletePermissionUseCase
 from app.application.use_cases.rbac.get_permission_for_role import GetPermissionForRoleUseCase
 from app.application.use_cases.products.create_product import CreateProductUseCase
+from app.application.use_cases.products.create_products_batch import CreateProductsBatchUseCase
+from app.application.use_cases.products.add_variants_batch import AddVariantsBatchUseCase
 from app.application.use_cases.products.update_product import UpdateProductUseCase
 from app.application.use_cases.products.publish_product import PublishProductUseCase
 from app.application.use_cases.products.archive_product import ArchiveProductUseCase
@@ -72,7 +74,7 @@ from app.application.use_cases.products.list_color_by_product import ListColorBy
 from app.application.use_cases.products.list_size_by_product import ListSizeByProductUseCase
 from app.application.use_cases.products.add_size import AddSizeUseCase
 from app.application.use_cases.products.remove_size import RemoveSizeUseCase
-from app.infrastructure.caching.memory_cache import MemoryCache
+from app.infrastructure.caching.memory_cache import AsyncMemoryCache, MemoryCache
 from app.infrastructure.caching.system_clock import SystemClock
 from app.infrastructure.observability.audit_logger import StructuredAuditLogger
 from app.infrastructure.security.jwt_service import JwtService
@@ -90,7 +92,9 @@ class Container:
     def __init__(self) -> None:
         # Ports (singletons)
         self._clock: ClockPort = SystemClock()
-        self._password_hasher: PasswordHasherPort = Argon2PasswordHasher()
+        self._password_hasher: PasswordHasherPort = Argon2PasswordHasher.from_profile(
+            settings.password_hash_profile
+        )
         self._token_hasher: TokenHasherPort = HmacTokenHasher(
             settings.refresh_token_hmac_secret
         )
@@ -119,7 +123,7 @@ class Container:
             
         
         self._audit_log: AuditLogPort = StructuredAuditLogger()
-        self._cache: CachePort = MemoryCache()
+        self._cache: CachePort = AsyncMemoryCache(MemoryCache())
 
     def get_password_hasher(self) -> PasswordHasherPort:
         """Get password hasher."""
@@ -326,6 +330,14 @@ class Container:
             audit_log=self._audit_log,
         )
 
+    def get_create_products_batch_use_case(self, session: AsyncSession) -> CreateProductsBatchUseCase:
+        """Get CreateProductsBatchUseCase."""
+        return CreateProductsBatchUseCase(
+            uow=self.get_uow(session),
+            clock=self._clock,
+            audit_log=self._audit_log,
+        )
+
     def get_update_product_use_case(self, session: AsyncSession) -> UpdateProductUseCase:
         """Get UpdateProductUseCase."""
         return UpdateProductUseCase(
@@ -360,6 +372,14 @@ class Container:
             audit_log=self._audit_log,
         )
 
+    def get_add_variants_batch_use_case(self, session: AsyncSession) -> AddVariantsBatchUseCase:
+        """Get AddVariantsBatchUseCase."""
+        return AddVariantsBatchUseCase(
+            uow=self.get_uow(session),
+            clock=self._clock,
+            audit_log=self._audit_log,
+        )
+
     def get_update_variant_use_case(self, session: AsyncSession) -> UpdateVariantUseCase:
         """Get UpdateVariantUseCase."""
         return UpdateVariantUseCase(
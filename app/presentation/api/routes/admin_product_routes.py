@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.product_dto import (
@@ -17,6 +17,8 @@ from app.application.dto.product_dto import (
     AssignCategoriesRequest,
     UploadProductImageRequest,
     UploadVariantImageRequest,
+    ProductDTO,
+    VariantDTO,
 )
 from app.application.dto.color_dto import ColorCreateRequest
 from app.application.dto.size_dto import SizeCreateRequest
@@ -60,6 +62,69 @@ from app.presentation.api.schemas.http_auth_schemas import MessageResponseSchema
 router = APIRouter(prefix="/admin/products", tags=["admin-products"])
 
 
+def _build_product_response(dto: ProductDTO) -> ProductResponseSchema:
+    return ProductResponseSchema(
+        id=dto.id,
+        status=dto.status,
+        name=dto.name,
+        slug=dto.slug,
+        description_short=dto.description_short,
+        description_long=dto.description_long,
+        tags=dto.tags,
+        featured=dto.featured,
+        sort_order=dto.sort_order,
+        created_at=dto.created_at,
+        updated_at=dto.updated_at,
+        created_by=dto.created_by,
+        updated_by=dto.updated_by,
+    )
+
+
+def _build_variant_response(dto: VariantDTO) -> VariantResponseSchema:
+    return VariantResponseSchema(
+        id=dto.id,
+        product_id=dto.product_id,
+        sku=dto.sku,
+        barcode=dto.barcode,
+        status=dto.status,
+        price=MoneySchema(amount=dto.price.amount, currency=dto.price.currency),
+        compare_at_price=(
+            MoneySchema(amount=dto.compare_at_price.amount, currency=dto.compare_at_price.currency)
+            if dto.compare_at_price
+            else None
+        ),
+        cost=MoneySchema(amount=dto.cost.amount, currency=dto.cost.currency) if dto.cost else None,
+        color_id=dto.color_id,
+        size_id=dto.size_id,
+        color=(
+            ColorResponseSchema(
+                id=dto.color.id,
+                name=dto.color.name,
+                hex_value=dto.color.hex_value,
+                created_at=dto.color.created_at,
+                updated_at=dto.color.updated_at,
+                product_id=dto.color.product_id,
+            )
+            if dto.color
+            else None
+        ),
+        size=(
+            SizeResponseSchema(
+                id=dto.size.id,
+                name=dto.size.name,
+                created_at=dto.size.created_at,
+                updated_at=dto.size.updated_at,
+                product_id=dto.size.product_id,
+            )
+            if dto.size
+            else None
+        ),
+        is_default=dto.is_default,
+        created_at=dto.created_at,
+        updated_at=dto.updated_at,
+    )
+
+
 @router.post(
     "",
     response_model=ProductResponseSchema,
@@ -87,21 +152,44 @@ async def create_product(
         )
         result = await use_case.execute(request)
 
-        return ProductResponseSchema(
-            id=result.id,
-            status=result.status,
-            name=result.name,
-            slug=result.slug,
-            description_short=result.description_short,
-            description_long=result.description_long,
-            tags=result.tags,
-            featured=result.featured,
-            sort_order=result.sort_order,
-            created_at=result.created_at,
-            updated_at=result.updated_at,
-            created_by=result.created_by,
-            updated_by=result.updated_by,
-        )
+        return _build_product_response(result)
+    except ConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post(
+    ":batch",
+    response_model=list[ProductResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission("products:write"))],
+)
+async def create_products_batch(
+    request_data: list[CreateProductRequestSchema] = Body(..., min_length=1, max_length=100),
+    principal: PrincipalDTO = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_session),
+    container: Container = Depends(get_container),
+) -> list[ProductResponseSchema]:
+    """Create several products in one transaction."""
+    use_case = container.get_create_products_batch_use_case(session)
+
+    try:
+        requests = [
+            CreateProductRequest(
+                name=item.name,
+                description_short=item.description_short,
+                description_long=item.description_long,
+                tags=item.tags,
+                featured=item.featured,
+                sort_order=item.sort_order,
+                created_by=principal.user_id,
+            )
+            for item in request_data
+        ]
+        results = await use_case.execute(requests)
+
+        return [_build_product_response(result) for result in results]
     except ConflictError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
@@ -446,48 +534,52 @@ async def add_variant(
         )
         result = await use_case.execute(request)
 
-        return VariantResponseSchema(
-            id=result.id,
-            product_id=result.product_id,
-            sku=result.sku,
-            barcode=result.barcode,
-            status=result.status,
-            price=MoneySchema(amount=result.price.amount, currency=result.price.currency),
-            compare_at_price=(
-                MoneySchema(amount=result.compare_at_price.amount, currency=result.compare_at_price.currency)
-                if result.compare_at_price
-                else None
-            ),
-            cost=MoneySchema(amount=result.cost.amount, currency=result.cost.currency) if result.cost else None,
-            color_id=result.color_id,
-            size_id=result.size_id,
-            color=(
-                ColorResponseSchema(
-                    id=result.color.id,
-                    name=result.color.name,
-                    hex_value=result.color.hex_value,
-                    created_at=result.color.created_at,
-                    updated_at=result.color.updated_at,
-                    product_id=result.color.product_id,
-                )
-                if result.color
-                else None
-            ),
-            size=(
-                SizeResponseSchema(
-                    id=result.size.id,
-                    name=result.size.name,
-                    created_at=result.size.created_at,
-                    updated_at=result.size.updated_at,
-                    product_id=result.size.product_id,
-                )
-                if result.size
-                else None
-            ),
-            is_default=result.is_default,
-            created_at=result.created_at,
-            updated_at=result.updated_at,
-        )
+        return _build_variant_response(result)
+    except (ResourceNotFoundError, ConflictError) as e:
+        status_code = status.HTTP_404_NOT_FOUND if isinstance(e, ResourceNotFoundError) else status.HTTP_409_CONFLICT
+        raise HTTPException(status_code=status_code, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post(
+    "/{product_id}/variants:batch",
+    response_model=list[VariantResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_permission("products:variant_write"))],
+)
+async def add_variants_batch(
+    product_id: UUID,
+    request_data: list[CreateVariantRequestSchema] = Body(..., min_length=1, max_length=100),
+    session: AsyncSession = Depends(get_session),
+    container: Container = Depends(get_container),
+) -> list[VariantResponseSchema]:
+    """Add several variants to product in one transaction."""
+    use_case = container.get_add_variants_batch_use_case(session)
+
+    try:
+        requests = [
+            CreateVariantRequest(
+                product_id=product_id,
+                sku=item.sku,
+                barcode=item.barcode,
+                price_amount=item.price_amount,
+                price_currency=item.price_currency,
+                compare_at_price_amount=item.compare_at_price_amount,
+                compare_at_price_currency=item.compare_at_price_currency,
+                cost_amount=item.cost_amount,
+                cost_currency=item.cost_currency,
+                color_id=item.color_id,
+                size_id=item.size_id,
+                is_default=item.is_default,
+                initial_stock=item.initial_stock,
+                allow_backorder=item.allow_backorder,
+            )
+            for item in request_data
+        ]
+        results = await use_case.execute(requests)
+
+        return [_build_variant_response(result) for result in results]
     except (ResourceNotFoundError, ConflictError) as e:
         status_code = status.HTTP_404_NOT_FOUND if isinstance(e, ResourceNotFoundError) else status.HTTP_409_CONFLICT
         raise HTTPException(status_code=status_code, detail=str(e))
@@ -525,48 +617,7 @@ async def update_variant(
         )
         result = await use_case.execute(request)
 
-        return VariantResponseSchema(
-            id=result.id,
-            product_id=result.product_id,
-            sku=result.sku,
-            barcode=result.barcode,
-            status=result.status,
-            price=MoneySchema(amount=result.price.amount, currency=result.price.currency),
-            compare_at_price=(
-                MoneySchema(amount=result.compare_at_price.amount, currency=result.compare_at_price.currency)
-                if result.compare_at_price
-                else None
-            ),
-            cost=MoneySchema(amount=result.cost.amount, currency=result.cost.currency) if result.cost else None,
-            color_id=result.color_id,
-            size_id=result.size_id,
-            color=(
-                ColorResponseSchema(
-                    id=result.color.id,
-                    name=result.color.name,
-                    hex_value=result.color.hex_value,
-                    created_at=result.color.created_at,
-                    updated_at=result.color.updated_at,
-                    product_id=result.color.product_id,
-                )
-                if result.color
-                else None
-            ),
-            size=(
-                SizeResponseSchema(
-                    id=result.size.id,
-                    name=result.size.name,
-                    created_at=result.size.created_at,
-                    updated_at=result.size.updated_at,
-                    product_id=result.size.product_id,
-                )
-                if result.size
-                else None
-            ),
-            is_default=result.is_default,
-            created_at=result.created_at,
-            updated_at=result.updated_at,
-        )
+        return _build_variant_response(result)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
@@ -590,48 +641,7 @@ async def deactivate_variant(
     try:
         result = await use_case.execute(variant_id, principal.user_id)
 
-        return VariantResponseSchema(
-            id=result.id,
-            product_id=result.product_id,
-            sku=result.sku,
-            barcode=result.barcode,
-            status=result.status,
-            price=MoneySchema(amount=result.price.amount, currency=result.price.currency),
-            compare_at_price=(
-                MoneySchema(amount=result.compare_at_price.amount, currency=result.compare_at_price.currency)
-                if result.compare_at_price
-                else None
-            ),
-            cost=MoneySchema(amount=result.cost.amount, currency=result.cost.currency) if result.cost else None,
-            color_id=result.color_id,
-            size_id=result.size_id,
-            color=(
-                ColorResponseSchema(
-                    id=result.color.id,
-                    name=result.color.name,
-                    hex_value=result.color.hex_value,
-                    created_at=result.color.created_at,
-                    updated_at=result.color.updated_at,
-                    product_id=result.color.product_id,
-                )
-                if result.color
-                else None
-            ),
-            size=(
-                SizeResponseSchema(
-                    id=result.size.id,
-                    name=result.size.name,
-                    created_at=result.size.created_at,
-                    updated_at=result.size.updated_at,
-                    product_id=result.size.product_id,
-                )
-                if result.size
-                else None
-            ),
-            is_default=result.is_default,
-            created_at=result.created_at,
-            updated_at=result.updated_at,
-        )
+        return _build_variant_response(result)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
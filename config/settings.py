@@ -1,7 +1,7 @@
 """Application configuration using Pydantic Settings."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +40,13 @@ class Settings(BaseSettings):
     cookie_secure: bool = Field(default=False)
     cookie_domain: str = Field(default="localhost")
 
+    # Password Hashing
+    # Only the RFC 9106 profiles: a stray env var must not downgrade real hashes
+    password_hash_profile: Literal["RFC_9106_LOW_MEMORY", "RFC_9106_HIGH_MEMORY"] = Field(
+        default="RFC_9106_LOW_MEMORY",
+        description="Argon2 cost profile from argon2.profiles"
+    )
+
     # Rate Limiting
     rate_limit_login_max_requests: int = Field(default=5)
     rate_limit_login_window_seconds: int = Field(default=60)
@@ -0,0 +1,125 @@
+"""Shared seeding logic for roles, permissions, and the bootstrap admin user."""
+
+import asyncio
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
+from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
+from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
+from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
+from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
+from app.infrastructure.security.password_hasher import Argon2PasswordHasher
+from config.settings import settings
+
+ADMIN_EMAIL = "admin@example.com"
+ADMIN_PASSWORD = "Admin123!"
+
+
+async def _get_or_create_role(session: AsyncSession, name: str) -> RoleModel:
+    """Return the role with the given name, creating it if missing."""
+    role = (
+        await session.execute(select(RoleModel).where(RoleModel.name == name))
+    ).scalar_one_or_none()
+    if not role:
+        role = RoleModel(id=uuid.uuid4(), name=name)
+        session.add(role)
+    return role
+
+
+async def _grant_permissions(
+    session: AsyncSession,
+    role: RoleModel,
+    permission_ids: Iterable[uuid.UUID],
+) -> None:
+    """Attach permissions to a role, skipping ones it already has."""
+    result = await session.execute(
+        select(RolePermissionModel.permission_id).where(RolePermissionModel.role_id == role.id)
+    )
+    granted_ids = set(result.scalars().all())
+    for permission_id in permission_ids:
+        if permission_id not in granted_ids:
+            session.add(RolePermissionModel(role_id=role.id, permission_id=permission_id))
+
+
+async def seed(
+    session: AsyncSession,
+    admin_perm_codes: Iterable[str],
+    user_perm_codes: Iterable[str],
+) -> None:
+    """
+    Seed roles, permissions, and the admin user (idempotent).
+
+    Creates the ``admin`` and ``user`` roles, every permission referenced by
+    either code list, the role-permission links, and an admin user holding the
+    ``admin`` role. Rows are only added to the session; the caller owns the
+    transaction and must commit.
+    """
+    admin_perm_codes = list(admin_perm_codes)
+    user_perm_codes = list(user_perm_codes)
+
+    # Primary keys are generated client-side, so apart from the bulk permission
+    # insert nothing needs to reach the database before the caller commits:
+    # the remaining rows go out in one flush.
+    with session.no_autoflush:
+        # Roles
+        admin_role = await _get_or_create_role(session, "admin")
+        user_role = await _get_or_create_role(session, "user")
+
+        # Permissions
+        permission_codes = list(dict.fromkeys([*admin_perm_codes, *user_perm_codes]))
+        result = await session.execute(
+            select(PermissionModel).where(PermissionModel.code.in_(permission_codes))
+        )
+        permission_ids = {perm.code: perm.id for perm in result.scalars().all()}
+        missing_codes = [code for code in permission_codes if code not in permission_ids]
+        if missing_codes:
+            # Permissions reference nothing, so insert them with one executemany
+            # instead of tracking each row in the unit of work
+            new_ids = {code: uuid.uuid4() for code in missing_codes}
+            await session.execute(
+                insert(PermissionModel),
+                [{"id": perm_id, "code": code} for code, perm_id in new_ids.items()],
+            )
+            permission_ids.update(new_ids)
+
+        # Role permissions
+        await _grant_permissions(
+            session, admin_role, (permission_ids[code] for code in admin_perm_codes)
+        )
+        await _grant_permissions(
+            session, user_role, (permission_ids[code] for code in user_perm_codes)
+        )
+
+        # Admin user
+        hasher = Argon2PasswordHasher.from_profile(settings.password_hash_profile)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        admin_user = (
+            await session.execute(select(UserModel).where(UserModel.email == ADMIN_EMAIL))
+        ).scalar_one_or_none()
+        if not admin_user:
+            admin_user = UserModel(
+                id=uuid.uuid4(),
+                email=ADMIN_EMAIL,
+                password_hash=await asyncio.to_thread(hasher.hash_password, ADMIN_PASSWORD),
+                is_active=True,
+                is_verified=True,
+                token_version=0,
+                created_at=now,
+                updated_at=now,
+            )
+            session.add(admin_user)
+
+        # Assign admin role to admin user
+        result = await session.execute(
+            select(UserRoleModel).where(
+                UserRoleModel.user_id == admin_user.id,
+                UserRoleModel.role_id == admin_role.id,
+            )
+        )
+        if not result.scalar_one_or_none():
+            session.add(UserRoleModel(user_id=admin_user.id, role_id=admin_role.id))
@@ -0,0 +1 @@
+"""Test infrastructure helpers package."""
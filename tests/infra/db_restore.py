@@ -0,0 +1,128 @@
+"""Fast test database reset by cloning a PostgreSQL template database."""
+
+import hashlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import MetaData, make_url, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """Hash of the DDL for ``metadata``, used to detect a stale template."""
+    dialect = postgresql.dialect()
+    ddl = []
+    for table in metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name or "")
+        )
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+class DatabaseRestorer:
+    """
+    Clones the test database from a schema template.
+
+    Holds one persistent AUTOCOMMIT connection to the ``postgres`` maintenance
+    database, so each restore is two statements on an open connection: no
+    process spawn, no reconnect, and no per-table DDL. The template itself is
+    built with ``create_all`` only when it is missing or its fingerprint
+    (stored as the database comment) no longer matches the models.
+    """
+
+    def __init__(self, database_url: str, template_database: str) -> None:
+        self._url = make_url(database_url)
+        self.database = self._url.database
+        self.template_database = template_database
+        self._admin_engine: AsyncEngine | None = None
+        self._admin_conn: AsyncConnection | None = None
+
+    async def connect(self) -> None:
+        """Open the persistent admin connection."""
+        self._admin_engine = create_async_engine(
+            self._url.set(database="postgres"),
+            isolation_level="AUTOCOMMIT",
+            poolclass=NullPool,
+        )
+        self._admin_conn = await self._admin_engine.connect()
+
+    async def close(self) -> None:
+        """Close the admin connection."""
+        if self._admin_conn is not None:
+            await self._admin_conn.close()
+            self._admin_conn = None
+        if self._admin_engine is not None:
+            await self._admin_engine.dispose()
+            self._admin_engine = None
+
+    async def ensure_template(self, metadata: MetaData) -> None:
+        """Build the template database unless an up-to-date one exists."""
+        async with self._template_lock() as conn:
+            await self._build_template(conn, metadata)
+
+    async def _build_template(self, conn: AsyncConnection, metadata: MetaData) -> None:
+        fingerprint = schema_fingerprint(metadata)
+        current = await conn.scalar(
+            text(
+                "SELECT shobj_description(oid, 'pg_database') "
+                "FROM pg_database WHERE datname = :name"
+            ),
+            {"name": self.template_database},
+        )
+        if current == fingerprint:
+            return
+
+        await conn.execute(
+            text(f'DROP DATABASE IF EXISTS "{self.template_database}" WITH (FORCE)')
+        )
+        await conn.execute(text(f'CREATE DATABASE "{self.template_database}"'))
+
+        template_engine = create_async_engine(
+            self._url.set(database=self.template_database), poolclass=NullPool
+        )
+        async with template_engine.begin() as template_conn:
+            # Freshly created database: skip the per-table existence checks
+            await template_conn.run_sync(metadata.create_all, checkfirst=False)
+        await template_engine.dispose()
+
+        await conn.execute(
+            text(f"COMMENT ON DATABASE \"{self.template_database}\" IS '{fingerprint}'")
+        )
+
+    async def restore(self) -> None:
+        """Drop the test database and recreate it as a copy of the template."""
+        async with self._template_lock() as conn:
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{self.database}" WITH (FORCE)'))
+            await conn.execute(
+                text(f'CREATE DATABASE "{self.database}" TEMPLATE "{self.template_database}"')
+            )
+
+    @asynccontextmanager
+    async def _template_lock(self) -> AsyncIterator[AsyncConnection]:
+        """
+        Serialize template use across parallel pytest-xdist workers.
+
+        Workers share one template: it must be built only once, and Postgres
+        refuses to clone a template that another session is connected to.
+        """
+        conn = self._connection()
+        await conn.execute(
+            text("SELECT pg_advisory_lock(hashtext(:name))"), {"name": self.template_database}
+        )
+        try:
+            yield conn
+        finally:
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:name))"),
+                {"name": self.template_database},
+            )
+
+    def _connection(self) -> AsyncConnection:
+        if self._admin_conn is None:
+            raise RuntimeError("DatabaseRestorer.connect() must be called first")
+        return self._admin_conn
@@ -0,0 +1,42 @@
+"""In-memory SQLite engine for running the test suite without PostgreSQL."""
+
+from sqlalchemy import MetaData, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+SQLITE_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+async def create_sqlite_engine(metadata: MetaData) -> AsyncEngine:
+    """
+    Create an in-memory SQLite engine with ``metadata`` already created.
+
+    ``StaticPool`` hands every checkout the same DBAPI connection, which is the
+    only way for an in-memory database to be shared at all. The driver's own
+    transaction handling is disabled and ``BEGIN`` emitted explicitly so that
+    SAVEPOINTs nest inside the outer test transaction like they do on
+    PostgreSQL; foreign keys are switched on to keep ``RESTRICT``/``CASCADE``
+    semantics. The database starts empty, so the schema is created without
+    ``create_all``'s per-table existence checks.
+    """
+    engine = create_async_engine(
+        SQLITE_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all, checkfirst=False)
+
+    return engine
@@ -2,87 +2,123 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import AsyncGenerator, Optional
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
-from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
-from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
-from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
-from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
-from app.infrastructure.security.password_hasher import Argon2PasswordHasher
-
-
-@pytest.fixture
-async def admin_user_with_permissions(session: AsyncSession) -> dict:
-    """Create admin user with product management permissions."""
-    hasher = Argon2PasswordHasher()
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.infrastructure.db.sqlalchemy.models.inventory_model import InventoryModel
+from app.infrastructure.db.sqlalchemy.models.product_image_model import ProductImageModel
+from app.infrastructure.db.sqlalchemy.models.product_variant_model import ProductVariantModel
+from tests.conftest import override_session
+
+
+async def _insert_default_variant(
+    session: AsyncSession,
+    product_id: str,
+    sku: str,
+    price_amount: int = 1000,
+    cost_amount: Optional[int] = None,
+) -> uuid.UUID:
+    """
+    Insert an active default variant and its empty inventory row.
+
+    Setup shortcut for tests that only need a variant to exist; the variant
+    endpoint itself is covered by ``test_add_variant_success``.
+    """
     now = datetime.now(timezone.utc).replace(tzinfo=None)
-
-    # Create admin role
-    admin_role = RoleModel(id=uuid.uuid4(), name="admin")
-    session.add(admin_role)
-
-    # Create all product permissions
-    permissions = [
-        PermissionModel(id=uuid.uuid4(), code="products:read"),
-        PermissionModel(id=uuid.uuid4(), code="products:write"),
-        PermissionModel(id=uuid.uuid4(), code="products:publish"),
-        PermissionModel(id=uuid.uuid4(), code="products:archive"),
-        PermissionModel(id=uuid.uuid4(), code="products:variant_write"),
-        PermissionModel(id=uuid.uuid4(), code="categories:read"),
-        PermissionModel(id=uuid.uuid4(), code="categories:write"),
-        PermissionModel(id=uuid.uuid4(), code="inventory:read"),
-        PermissionModel(id=uuid.uuid4(), code="inventory:adjust"),
-        PermissionModel(id=uuid.uuid4(), code="products:media_write"),
-    ]
-    session.add_all(permissions)
+    variant_id = uuid.uuid4()
+    session.add(
+        ProductVariantModel(
+            id=variant_id,
+            product_id=uuid.UUID(product_id),
+            sku=sku,
+            status="ACTIVE",
+            price_amount=price_amount,
+            price_currency="USD",
+            cost_amount=cost_amount,
+            cost_currency="USD" if cost_amount is not None else None,
+            is_default=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    # The mappers have no relationship, so the unit of work would not order the
+    # inventory insert after its variant; flush the variant first for the FK
     await session.flush()
+    session.add(InventoryModel(variant_id=variant_id, on_hand=0, reserved=0, allow_backorder=False))
+    await session.commit()
+    return variant_id
+
+
+async def _create_published_product(
+    client: AsyncClient,
+    session: AsyncSession,
+    auth_headers: dict,
+    name: str,
+    slug: str,
+    sku: str,
+) -> dict:
+    """Create a product with one default variant (with cost) and publish it."""
+    create_response = await client.post(
+        "/admin/products",
+        json={"name": name, "slug": slug},
+        headers=auth_headers,
+    )
+    product_id = create_response.json()["id"]
 
-    # Assign permissions to admin role
-    for perm in permissions:
-        role_perm = RolePermissionModel(role_id=admin_role.id, permission_id=perm.id)
-        session.add(role_perm)
-
-    # Create admin user
-    admin_user_id = uuid.uuid4()
-    admin_user = UserModel(
-        id=admin_user_id,
-        email="admin@test.com",
-        password_hash=hasher.hash_password("Admin123!"),
-        is_active=True,
-        is_verified=True,
-        token_version=0,
-        created_at=now,
-        updated_at=now,
-    )
-    session.add(admin_user)
-    await session.flush()
+    await _insert_default_variant(
+        session, product_id, sku, price_amount=2999, cost_amount=1500
+    )
 
-    # Assign role to user
-    user_role = UserRoleModel(user_id=admin_user_id, role_id=admin_role.id)
-    session.add(user_role)
+    publish_response = await client.post(
+        f"/admin/products/{product_id}/publish", headers=auth_headers
+    )
+    assert publish_response.status_code == 200
+    return publish_response.json()
+
+
+@pytest.fixture(scope="module")
+async def published_product(
+    http_client: AsyncClient,
+    connection: AsyncConnection,
+    shared_session: AsyncSession,
+    auth_headers: dict,
+) -> AsyncGenerator[dict, None]:
+    """Published product built once for the module's read-only tests."""
+    savepoint = await connection.begin_nested()
+
+    with override_session(shared_session):
+        product = await _create_published_product(
+            http_client,
+            shared_session,
+            auth_headers,
+            name="Published Fixture Product",
+            slug="published-fixture-product",
+            sku="PUB-FIXTURE-001",
+        )
 
-    await session.commit()
+    yield product
 
-    return {"email": "admin@test.com", "password": "Admin123!"}
+    # Drop the product again so it cannot leak into other modules' listings
+    if savepoint.is_active:
+        await savepoint.rollback()
 
 
 @pytest.fixture
-async def auth_headers(client: AsyncClient, admin_user_with_permissions: dict) -> dict:
-    """Get authentication headers for admin user."""
-    login_response = await client.post(
-        "/auth/login",
-        json={
-            "email": admin_user_with_permissions["email"],
-            "password": admin_user_with_permissions["password"],
-        },
+async def published_product_new(
+    client: AsyncClient, session: AsyncSession, auth_headers: dict
+) -> dict:
+    """Fresh published product for tests that mutate it (rolled back per test)."""
+    return await _create_published_product(
+        client,
+        session,
+        auth_headers,
+        name="Published Product",
+        slug="published-product",
+        sku="PUB-NEW-001",
     )
-    assert login_response.status_code == 200
-    token = login_response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.mark.asyncio
@@ -380,7 +416,9 @@ async def test_add_size_invalid_product(client: AsyncClient, auth_headers: dict)
 
 
 @pytest.mark.asyncio
-async def test_publish_product_workflow(client: AsyncClient, auth_headers: dict):
+async def test_publish_product_workflow(
+    client: AsyncClient, session: AsyncSession, auth_headers: dict
+):
     """Test full product publish workflow."""
     # Create product
     create_response = await client.post(
@@ -397,16 +435,7 @@ async def test_publish_product_workflow(client: AsyncClient, auth_headers: dict)
     assert publish_response.status_code == 400
 
     # Add variant
-    await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "PUB-SKU-001",
-            "price_amount": 1000,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
+    await _insert_default_variant(session, product_id, "PUB-SKU-001")
 
     # Publish should now succeed
     publish_response = await client.post(
@@ -417,28 +446,11 @@ async def test_publish_product_workflow(client: AsyncClient, auth_headers: dict)
 
 
 @pytest.mark.asyncio
-async def test_archive_product_success(client: AsyncClient, auth_headers: dict):
+async def test_archive_product_success(
+    client: AsyncClient, auth_headers: dict, published_product_new: dict
+):
     """Test archiving a product."""
-    # Create and publish product
-    create_response = await client.post(
-        "/admin/products",
-        json={"name": "Product to Archive", "slug": "archive-product"},
-        headers=auth_headers,
-    )
-    product_id = create_response.json()["id"]
-
-    # Add variant and publish
-    await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "ARCH-SKU-001",
-            "price_amount": 1000,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    await client.post(f"/admin/products/{product_id}/publish", headers=auth_headers)
+    product_id = published_product_new["id"]
 
     # Archive
     response = await client.post(
@@ -450,7 +462,9 @@ async def test_archive_product_success(client: AsyncClient, auth_headers: dict):
 
 
 @pytest.mark.asyncio
-async def test_adjust_stock_success(client: AsyncClient, auth_headers: dict):
+async def test_adjust_stock_success(
+    client: AsyncClient, session: AsyncSession, auth_headers: dict
+):
     """Test adjusting stock for a variant."""
     # Create product and variant
     create_response = await client.post(
@@ -460,17 +474,7 @@ async def test_adjust_stock_success(client: AsyncClient, auth_headers: dict):
     )
     product_id = create_response.json()["id"]
 
-    variant_response = await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "STOCK-SKU-001",
-            "price_amount": 1000,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    variant_id = variant_response.json()["id"]
+    variant_id = await _insert_default_variant(session, product_id, "STOCK-SKU-001")
 
     # Adjust stock
     response = await client.post(
@@ -511,7 +515,7 @@ async def test_add_product_image_success(client: AsyncClient, auth_headers: dict
 
 
 @pytest.mark.asyncio
-async def test_reorder_images(client: AsyncClient, auth_headers: dict):
+async def test_reorder_images(client: AsyncClient, session: AsyncSession, auth_headers: dict):
     """Test reordering product images."""
     # Create product
     create_response = await client.post(
@@ -521,26 +525,23 @@ async def test_reorder_images(client: AsyncClient, auth_headers: dict):
     )
     product_id = create_response.json()["id"]
 
-    # Add three images
-    image1 = await client.post(
-        f"/admin/products/{product_id}/images",
-        json={"url": "https://example.com/image1.jpg", "alt_text": "Image 1"},
-        headers=auth_headers,
-    )
-    image2 = await client.post(
-        f"/admin/products/{product_id}/images",
-        json={"url": "https://example.com/image2.jpg", "alt_text": "Image 2"},
-        headers=auth_headers,
-    )
-    image3 = await client.post(
-        f"/admin/products/{product_id}/images",
-        json={"url": "https://example.com/image3.jpg", "alt_text": "Image 3"},
-        headers=auth_headers,
+    # Add three images in one flush. Creating them over HTTP can't be made
+    # concurrent: every request shares the test's AsyncSession, and the add
+    # endpoint derives each position from the images that already exist.
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    image1_id, image2_id, image3_id = (str(uuid.uuid4()) for _ in range(3))
+    session.add_all(
+        ProductImageModel(
+            id=uuid.UUID(image_id),
+            product_id=uuid.UUID(product_id),
+            url=f"https://example.com/image{position + 1}.jpg",
+            alt_text=f"Image {position + 1}",
+            position=position,
+            created_at=now,
+        )
+        for position, image_id in enumerate((image1_id, image2_id, image3_id))
     )
-
-    image1_id = image1.json()["id"]
-    image2_id = image2.json()["id"]
-    image3_id = image3.json()["id"]
+    await session.flush()
 
     # Reorder (swap positions)
     response = await client.post(
@@ -555,13 +556,14 @@ async def test_reorder_images(client: AsyncClient, auth_headers: dict):
 @pytest.mark.asyncio
 async def test_list_products_admin_pagination(client: AsyncClient, auth_headers: dict):
     """Test admin product list with pagination."""
-    # Create multiple products
-    for i in range(5):
-        await client.post(
-            "/admin/products",
-            json={"name": f"Product {i}", "slug": f"product-{i}"},
-            headers=auth_headers,
-        )
+    # Create multiple products in one batch request
+    batch_response = await client.post(
+        "/admin/products:batch",
+        json=[{"name": f"Product {i}"} for i in range(5)],
+        headers=auth_headers,
+    )
+    assert batch_response.status_code == 201
+    assert len(batch_response.json()) == 5
 
     # Get first page
     response = await client.get(
@@ -576,36 +578,16 @@ async def test_list_products_admin_pagination(client: AsyncClient, auth_headers:
 
 
 @pytest.mark.asyncio
-async def test_list_products_filter_by_status(client: AsyncClient, auth_headers: dict):
+async def test_list_products_filter_by_status(
+    client: AsyncClient, auth_headers: dict, published_product_new: dict
+):
     """Test filtering products by status."""
-    # Create draft product
-    draft_response = await client.post(
+    # Create draft product (a published one comes from the fixture)
+    await client.post(
         "/admin/products",
         json={"name": "Draft Product", "slug": "draft-product"},
         headers=auth_headers,
     )
-    draft_id = draft_response.json()["id"]
-
-    # Create and publish another product
-    published_response = await client.post(
-        "/admin/products",
-        json={"name": "Published Product", "slug": "published-product"},
-        headers=auth_headers,
-    )
-    published_id = published_response.json()["id"]
-
-    # Add variant and publish
-    await client.post(
-        f"/admin/products/{published_id}/variants",
-        json={
-            "sku": "PUB-FILTER-001",
-            "price_amount": 1000,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    await client.post(f"/admin/products/{published_id}/publish", headers=auth_headers)
 
     # Filter by DRAFT
     draft_filter_response = await client.get(
@@ -623,35 +605,17 @@ async def test_list_products_filter_by_status(client: AsyncClient, auth_headers:
 
 
 @pytest.mark.asyncio
-async def test_storefront_list_only_published(client: AsyncClient, auth_headers: dict):
+async def test_storefront_list_only_published(
+    client: AsyncClient, auth_headers: dict, published_product_new: dict
+):
     """Test that storefront only shows published products."""
-    # Create draft product
+    # Create draft product (a published one comes from the fixture)
     await client.post(
         "/admin/products",
         json={"name": "Draft Storefront", "slug": "draft-storefront"},
         headers=auth_headers,
     )
 
-    # Create and publish product
-    published_response = await client.post(
-        "/admin/products",
-        json={"name": "Published Storefront", "slug": "published-storefront"},
-        headers=auth_headers,
-    )
-    published_id = published_response.json()["id"]
-
-    await client.post(
-        f"/admin/products/{published_id}/variants",
-        json={
-            "sku": "STORE-PUB-001",
-            "price_amount": 1000,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    await client.post(f"/admin/products/{published_id}/publish", headers=auth_headers)
-
     # Query storefront (no auth required)
     response = await client.get("/store/products")
 
@@ -659,71 +623,29 @@ async def test_storefront_list_only_published(client: AsyncClient, auth_headers:
     products = response.json()["items"]
     # Should only see published product
     assert all(p["status"] == "PUBLISHED" for p in products)
-    assert any(p["slug"] == "published-storefront" for p in products)
+    assert any(p["slug"] == published_product_new["slug"] for p in products)
     assert not any(p["slug"] == "draft-storefront" for p in products)
 
 
 @pytest.mark.asyncio
-async def test_storefront_get_by_slug(client: AsyncClient, auth_headers: dict):
+async def test_storefront_get_by_slug(client: AsyncClient, published_product: dict):
     """Test getting published product by slug on storefront."""
-    # Create and publish product
-    create_response = await client.post(
-        "/admin/products",
-        json={"name": "Slug Test Product", "slug": "slug-test-product"},
-        headers=auth_headers,
-    )
-    product_id = create_response.json()["id"]
-
-    await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "SLUG-TEST-001",
-            "price_amount": 2999,
-            "price_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    await client.post(f"/admin/products/{product_id}/publish", headers=auth_headers)
-
     # Get by slug on storefront (no auth)
-    response = await client.get("/store/products/slug-test-product")
+    response = await client.get(f"/store/products/{published_product['slug']}")
 
     assert response.status_code == 200
     data = response.json()
-    assert data["slug"] == "slug-test-product"
-    assert data["name"] == "Slug Test Product"
+    assert data["slug"] == published_product["slug"]
+    assert data["name"] == "Published Fixture Product"
     assert len(data["variants"]) == 1
-    assert data["variants"][0]["sku"] == "SLUG-TEST-001"
+    assert data["variants"][0]["sku"] == "PUB-FIXTURE-001"
 
 
 @pytest.mark.asyncio
-async def test_storefront_does_not_show_cost(client: AsyncClient, auth_headers: dict):
+async def test_storefront_does_not_show_cost(client: AsyncClient, published_product: dict):
     """Test that storefront hides cost field."""
-    # Create product with variant including cost
-    create_response = await client.post(
-        "/admin/products",
-        json={"name": "Cost Hidden Product", "slug": "cost-hidden"},
-        headers=auth_headers,
-    )
-    product_id = create_response.json()["id"]
-
-    await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "COST-TEST-001",
-            "price_amount": 2999,
-            "price_currency": "USD",
-            "cost_amount": 1500,
-            "cost_currency": "USD",
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    await client.post(f"/admin/products/{product_id}/publish", headers=auth_headers)
-
-    # Get from storefront
-    response = await client.get("/store/products/cost-hidden")
+    # The fixture's variant is created with a cost; get it from the storefront
+    response = await client.get(f"/store/products/{published_product['slug']}")
 
     assert response.status_code == 200
     data = response.json()
@@ -793,37 +715,33 @@ async def test_get_product_with_variants_and_dimensions(client: AsyncClient, aut
     )
     product_id = create_response.json()["id"]
 
-    # Add variant with full dimensions
-    variant_response = await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "VARIANT-001",
-            "barcode": "9876543210",
-            "price_amount": 2999,
-            "price_currency": "USD",
-            "weight": 750,
-            "length": 150,
-            "width": 100,
-            "height": 50,
-            "is_default": True,
-        },
-        headers=auth_headers,
-    )
-    assert variant_response.status_code == 201
-
-    # Add second variant with partial dimensions
-    variant2_response = await client.post(
-        f"/admin/products/{product_id}/variants",
-        json={
-            "sku": "VARIANT-002",
-            "price_amount": 1999,
-            "price_currency": "USD",
-            "weight": 500,
-            "is_default": False,
-        },
-        headers=auth_headers,
-    )
-    assert variant2_response.status_code == 201
+    # Add one variant with full dimensions and one with partial dimensions
+    variants_response = await client.post(
+        f"/admin/products/{product_id}/variants:batch",
+        json=[
+            {
+                "sku": "VARIANT-001",
+                "barcode": "9876543210",
+                "price_amount": 2999,
+                "price_currency": "USD",
+                "weight": 750,
+                "length": 150,
+                "width": 100,
+                "height": 50,
+                "is_default": True,
+            },
+            {
+                "sku": "VARIANT-002",
+                "price_amount": 1999,
+                "price_currency": "USD",
+                "weight": 500,
+                "is_default": False,
+            },
+        ],
+        headers=auth_headers,
+    )
+    assert variants_response.status_code == 201
+    assert len(variants_response.json()) == 2
 
     # Get product detail
     response = await client.get(f"/admin/products/{product_id}", headers=auth_headers)
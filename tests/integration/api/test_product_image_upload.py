@@ -2,6 +2,7 @@
 
 import io
 import uuid
+from datetime import datetime, timezone
 
 import pytest
 from httpx import AsyncClient
@@ -9,13 +10,8 @@ from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.product import ProductStatus
-from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
 from app.infrastructure.db.sqlalchemy.models.product_model import ProductModel
 from app.infrastructure.db.sqlalchemy.models.product_variant_model import ProductVariantModel
-from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
-from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
-from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
-from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
 
 
 def create_test_image_bytes(width: int = 100, height: int = 100) -> bytes:
@@ -27,40 +23,17 @@ def create_test_image_bytes(width: int = 100, height: int = 100) -> bytes:
     return img_bytes.read()
 
 
+# The default red 100x100 PNG is constant, so encode it once for the module
+_TEST_IMAGE_BYTES = create_test_image_bytes()
+
+
 @pytest.mark.asyncio
-async def test_upload_product_image_success(client: AsyncClient, session: AsyncSession):
+async def test_upload_product_image_success(
+    client: AsyncClient, session: AsyncSession, uploader_token: dict
+):
     """Test successful product image upload."""
-    # Create user with permission
-    user = UserModel(
-        id=uuid.uuid4(),
-        email="testuser@example.com",
-        password_hash="hashed",
-        is_active=True,
-        token_version=0,
-    )
-    session.add(user)
-    
-    # Create role and permission
-    permission = PermissionModel(
-        id=uuid.uuid4(),
-        code="products:media_write",
-        name="Product Media Write",
-    )
-    session.add(permission)
-    
-    role = RoleModel(id=uuid.uuid4(), code="admin", name="Admin")
-    session.add(role)
-    await session.flush()
-    
-    # Assign permission to role
-    role_perm = RolePermissionModel(role_id=role.id, permission_id=permission.id)
-    session.add(role_perm)
-    
-    # Assign role to user
-    user_role = UserRoleModel(user_id=user.id, role_id=role.id)
-    session.add(user_role)
-    
     # Create product
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     product = ProductModel(
         id=uuid.uuid4(),
         name="Test Product",
@@ -68,47 +41,30 @@ async def test_upload_product_image_success(client: AsyncClient, session: AsyncS
         status=ProductStatus.DRAFT.value,
         featured=False,
         sort_order=0,
+        created_at=now,
+        updated_at=now,
     )
     session.add(product)
     await session.commit()
     
-    # Register and login to get token
-    response = await client.post(
-        "/auth/register",
-        json={"email": "uploader@example.com", "password": "SecurePass123"},
-    )
-    assert response.status_code == 201
-    
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "uploader@example.com", "password": "SecurePass123"},
-    )
-    assert login_response.status_code == 200
-    token = login_response.json()["access_token"]
-    
-    # Create test image
-    image_bytes = create_test_image_bytes()
-    
     # Upload image
     response = await client.post(
         f"/admin/products/{product.id}/images/upload",
-        headers={"Authorization": f"Bearer {token}"},
-        files={"file": ("test.png", image_bytes, "image/png")},
+        headers=uploader_token,
+        files={"file": ("test.png", _TEST_IMAGE_BYTES, "image/png")},
         data={"alt_text": "Test image", "position": "0"},
     )
     
-    # Note: Without proper RBAC setup in test, this might fail with 403
-    # In a real scenario, we'd need to properly set up the admin user
-    # For now, we check that the endpoint exists and accepts the request
-    assert response.status_code in [201, 401, 403]  # Could be 401 if auth not set up
+    assert response.status_code == 201
 
 
 @pytest.mark.asyncio
 async def test_upload_product_image_invalid_content_type(
-    client: AsyncClient, session: AsyncSession
+    client: AsyncClient, session: AsyncSession, uploader_token: dict
 ):
     """Test upload fails with invalid content type."""
     # Create product
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     product = ProductModel(
         id=uuid.uuid4(),
         name="Test Product",
@@ -116,35 +72,29 @@ async def test_upload_product_image_invalid_content_type(
         status=ProductStatus.DRAFT.value,
         featured=False,
         sort_order=0,
+        created_at=now,
+        updated_at=now,
     )
     session.add(product)
     await session.commit()
     
-    # Register and login
-    response = await client.post(
-        "/auth/register",
-        json={"email": "uploader2@example.com", "password": "SecurePass123"},
-    )
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "uploader2@example.com", "password": "SecurePass123"},
-    )
-    token = login_response.json()["access_token"]
-    
     # Try to upload non-image file
     response = await client.post(
         f"/admin/products/{product.id}/images/upload",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=uploader_token,
         files={"file": ("test.txt", b"not an image", "text/plain")},
     )
     
-    assert response.status_code in [400, 401, 403]
+    assert response.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_upload_variant_image_success(client: AsyncClient, session: AsyncSession):
+async def test_upload_variant_image_success(
+    client: AsyncClient, session: AsyncSession, uploader_token: dict
+):
     """Test successful variant image upload."""
     # Create product and variant
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     product = ProductModel(
         id=uuid.uuid4(),
         name="Test Product",
@@ -152,6 +102,8 @@ async def test_upload_variant_image_success(client: AsyncClient, session: AsyncS
         status=ProductStatus.DRAFT.value,
         featured=False,
         sort_order=0,
+        created_at=now,
+        updated_at=now,
     )
     session.add(product)
     await session.flush()
@@ -164,58 +116,32 @@ async def test_upload_variant_image_success(client: AsyncClient, session: AsyncS
         price_amount=1000,
         price_currency="USD",
         is_default=True,
+        created_at=now,
+        updated_at=now,
     )
     session.add(variant)
     await session.commit()
     
-    # Register and login
-    response = await client.post(
-        "/auth/register",
-        json={"email": "uploader3@example.com", "password": "SecurePass123"},
-    )
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "uploader3@example.com", "password": "SecurePass123"},
-    )
-    token = login_response.json()["access_token"]
-    
-    # Create test image
-    image_bytes = create_test_image_bytes()
-    
     # Upload image
     response = await client.post(
         f"/admin/products/variants/{variant.id}/images/upload",
-        headers={"Authorization": f"Bearer {token}"},
-        files={"file": ("test.png", image_bytes, "image/png")},
+        headers=uploader_token,
+        files={"file": ("test.png", _TEST_IMAGE_BYTES, "image/png")},
         data={"alt_text": "Variant image"},
     )
     
-    assert response.status_code in [201, 401, 403]
+    assert response.status_code == 201
 
 
 @pytest.mark.asyncio
-async def test_upload_product_image_not_found(client: AsyncClient):
+async def test_upload_product_image_not_found(client: AsyncClient, uploader_token: dict):
     """Test upload fails when product doesn't exist."""
-    # Register and login
-    response = await client.post(
-        "/auth/register",
-        json={"email": "uploader4@example.com", "password": "SecurePass123"},
-    )
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "uploader4@example.com", "password": "SecurePass123"},
-    )
-    token = login_response.json()["access_token"]
-    
-    # Create test image
-    image_bytes = create_test_image_bytes()
-    
     # Try to upload to non-existent product
     fake_id = uuid.uuid4()
     response = await client.post(
         f"/admin/products/{fake_id}/images/upload",
-        headers={"Authorization": f"Bearer {token}"},
-        files={"file": ("test.png", image_bytes, "image/png")},
+        headers=uploader_token,
+        files={"file": ("test.png", _TEST_IMAGE_BYTES, "image/png")},
     )
     
-    assert response.status_code in [404, 401, 403]
+    assert response.status_code == 404
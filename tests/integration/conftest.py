@@ -0,0 +1,258 @@
+"""Shared fixtures for integration tests."""
+
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
+from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
+from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
+from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
+from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
+from app.presentation.api.deps.container import get_container
+from tests.conftest import FAST_PASSWORD_HASHER, override_session
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Pin each integration module to a single pytest-xdist worker.
+
+    Under ``--dist loadgroup`` module-scoped fixtures (published products, the
+    shared user) are then built once instead of once per worker, while the
+    ungrouped unit tests are still spread across every worker.
+    """
+    for item in items:
+        if _INTEGRATION_DIR in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+# Timestamps of session-wide fixture rows; no test depends on their value
+_FIXED_NOW = datetime(2025, 1, 1)
+
+# Placeholder hash for users that never log in (skips Argon2 entirely)
+_UNUSED_PASSWORD_HASH = "unused"
+
+# Argon2 is deliberately slow, so hash the admin password once at import
+_ADMIN_PASSWORD_HASH = FAST_PASSWORD_HASHER.hash_password("Admin123!")
+
+# Password of the canonical test users, hashed once as well
+_USER_PASSWORD = "SecurePass123"
+_USER_PASSWORD_HASH = FAST_PASSWORD_HASHER.hash_password(_USER_PASSWORD)
+
+_ADMIN_PERMISSION_CODES = [
+    "products:read",
+    "products:write",
+    "products:publish",
+    "products:archive",
+    "products:variant_write",
+    "categories:read",
+    "categories:write",
+    "inventory:read",
+    "inventory:adjust",
+    "products:media_write",
+]
+
+
+@pytest.fixture(scope="session")
+def admin_password_hash() -> str:
+    """Argon2 hash of the admin password ``Admin123!``."""
+    return _ADMIN_PASSWORD_HASH
+
+
+@pytest.fixture(scope="session")
+async def admin_user_with_permissions(shared_session: AsyncSession) -> dict:
+    """Create admin user with product management permissions (once per session)."""
+    session = shared_session
+
+    # Create admin role
+    admin_role = RoleModel(id=uuid.uuid4(), name="catalog-admin")
+    session.add(admin_role)
+
+    # Create all product permissions and grant them to the role in two
+    # executemany statements (ids are client-side, so no RETURNING needed)
+    permission_ids = {code: uuid.uuid4() for code in _ADMIN_PERMISSION_CODES}
+    await session.execute(
+        insert(PermissionModel),
+        [{"id": perm_id, "code": code} for code, perm_id in permission_ids.items()],
+    )
+    await session.execute(
+        insert(RolePermissionModel),
+        [
+            {"role_id": admin_role.id, "permission_id": perm_id}
+            for perm_id in permission_ids.values()
+        ],
+    )
+
+    # Create admin user
+    admin_user_id = uuid.uuid4()
+    admin_user = UserModel(
+        id=admin_user_id,
+        email="admin@test.com",
+        password_hash=_ADMIN_PASSWORD_HASH,
+        is_active=True,
+        is_verified=True,
+        token_version=0,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
+    session.add(admin_user)
+
+    # Assign role to user (FKs are client-side UUIDs, so the unit of work
+    # orders the user and user_role INSERTs in the single flush below)
+    user_role = UserRoleModel(user_id=admin_user_id, role_id=admin_role.id)
+    session.add(user_role)
+
+    # Flush only: the rows stay in the outer test transaction for the session
+    await session.flush()
+
+    return {"email": "admin@test.com", "password": "Admin123!"}
+
+
+@pytest.fixture
+async def pre_hashed_user(session: AsyncSession) -> dict:
+    """
+    Active user inserted directly with a precomputed password hash.
+
+    For tests that only need an existing user: skips ``/auth/register`` and its
+    Argon2 hashing. The row is rolled back with the test's SAVEPOINT.
+    """
+    user_id = uuid.uuid4()
+    session.add(
+        UserModel(
+            id=user_id,
+            email="prehashed@example.com",
+            password_hash=_USER_PASSWORD_HASH,
+            is_active=True,
+            is_verified=True,
+            token_version=0,
+            created_at=_FIXED_NOW,
+            updated_at=_FIXED_NOW,
+        )
+    )
+    await session.commit()
+
+    return {"email": "prehashed@example.com", "password": _USER_PASSWORD, "user_id": user_id}
+
+
+@pytest.fixture(scope="session")
+async def auth_headers(
+    http_client: AsyncClient, shared_session: AsyncSession, admin_user_with_permissions: dict
+) -> dict:
+    """Get authentication headers for admin user (logged in once per session)."""
+    with override_session(shared_session):
+        login_response = await http_client.post(
+            "/auth/login",
+            json={
+                "email": admin_user_with_permissions["email"],
+                "password": admin_user_with_permissions["password"],
+            },
+        )
+    assert login_response.status_code == 200
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+async def uploader_token(
+    shared_session: AsyncSession, admin_user_with_permissions: dict
+) -> dict:
+    """
+    Authorization headers for a user holding only ``products:media_write``.
+
+    The token is issued directly rather than through ``/auth/login``: the user
+    never authenticates with a password, so no Argon2 hash and no login round
+    trip (or rate-limit slot) is spent on it.
+    """
+    session = shared_session
+
+    # The permission row already exists for the catalog admin
+    permission_id = (
+        await session.execute(
+            select(PermissionModel.id).where(PermissionModel.code == "products:media_write")
+        )
+    ).scalar_one()
+
+    uploader_role = RoleModel(id=uuid.uuid4(), name="media-uploader")
+    uploader = UserModel(
+        id=uuid.uuid4(),
+        email="uploader@test.com",
+        password_hash=_UNUSED_PASSWORD_HASH,
+        is_active=True,
+        is_verified=True,
+        token_version=0,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
+    session.add_all([uploader_role, uploader])
+    session.add(RolePermissionModel(role_id=uploader_role.id, permission_id=permission_id))
+    session.add(UserRoleModel(user_id=uploader.id, role_id=uploader_role.id))
+    await session.flush()
+
+    token = get_container().get_jwt_service().issue_access_token(
+        uploader.id, [uploader_role.name], uploader.token_version
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="module")
+async def shared_user(
+    request: pytest.FixtureRequest, http_client: AsyncClient, shared_session: AsyncSession
+) -> dict:
+    """
+    Registered and logged-in user shared by a module's tests.
+
+    Registration and login run once per module. Tests may log out, rotate
+    the refresh token or change the password: those writes happen inside the
+    test's SAVEPOINT and are rolled back, so every test sees the same user.
+    Tests about registration itself still register their own users.
+    """
+    # One user per module; the rows stay in the outer transaction until the
+    # session ends, so the address must not repeat across modules
+    module_name = request.module.__name__.rsplit(".", 1)[-1]
+    credentials = {"email": f"shared-{module_name}@example.com", "password": "SecurePass123"}
+
+    with override_session(shared_session):
+        register_response = await http_client.post("/auth/register", json=credentials)
+        assert register_response.status_code == 201
+
+        login_response = await http_client.post("/auth/login", json=credentials)
+        assert login_response.status_code == 200
+    http_client.cookies.clear()
+
+    return {
+        **credentials,
+        "access_token": login_response.json()["access_token"],
+        "refresh_token": login_response.cookies["refresh_token"],
+        "csrf_token": login_response.cookies["csrf_token"],
+    }
+
+
+@pytest.fixture(scope="session")
+async def seeded_roles(shared_session: AsyncSession) -> dict:
+    """
+    Standard ``admin`` role holding ``rbac:assign``, seeded once per session.
+
+    The rows live in the outer test transaction, so every test sees them while
+    its own writes still roll back with its SAVEPOINT.
+    """
+    session = shared_session
+    admin_role_id = uuid.uuid4()
+    rbac_assign_id = uuid.uuid4()
+
+    await session.execute(insert(RoleModel), [{"id": admin_role_id, "name": "admin"}])
+    await session.execute(
+        insert(PermissionModel), [{"id": rbac_assign_id, "code": "rbac:assign"}]
+    )
+    await session.execute(
+        insert(RolePermissionModel),
+        [{"role_id": admin_role_id, "permission_id": rbac_assign_id}],
+    )
+
+    return {"admin_role_id": admin_role_id, "rbac_assign_permission_id": rbac_assign_id}
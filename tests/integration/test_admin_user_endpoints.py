@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
@@ -12,62 +13,50 @@ from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
 from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
 from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
 from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
-from app.infrastructure.security.password_hasher import Argon2PasswordHasher
 
 
-async def _create_admin_with_permission(session: AsyncSession, permission_code: str) -> dict:
-    hasher = Argon2PasswordHasher()
+async def _create_admin_with_permission(
+    session: AsyncSession, permission_code: str, password_hash: str
+) -> dict:
     now = datetime.now(timezone.utc).replace(tzinfo=None)
-
-    role = RoleModel(id=uuid.uuid4(), name="admin-users")
-    perm = PermissionModel(id=uuid.uuid4(), code=permission_code)
-    session.add_all([role, perm])
-    await session.flush()
-
-    session.add(RolePermissionModel(role_id=role.id, permission_id=perm.id))
-
+    role_id = uuid.uuid4()
+    perm_id = uuid.uuid4()
     admin_id = uuid.uuid4()
-    session.add(
-        UserModel(
-            id=admin_id,
-            email="admin-users@test.com",
-            password_hash=hasher.hash_password("Admin123!"),
-            is_active=True,
-            is_verified=True,
-            token_version=0,
-            created_at=now,
-            updated_at=now,
-        )
+
+    # Core inserts skip the unit of work; issued in foreign-key order
+    await session.execute(insert(RoleModel), [{"id": role_id, "name": "admin-users"}])
+    await session.execute(insert(PermissionModel), [{"id": perm_id, "code": permission_code}])
+    await session.execute(
+        insert(RolePermissionModel), [{"role_id": role_id, "permission_id": perm_id}]
+    )
+    await session.execute(
+        insert(UserModel),
+        [
+            {
+                "id": admin_id,
+                "email": "admin-users@test.com",
+                "password_hash": password_hash,
+                "is_active": True,
+                "is_verified": True,
+                "token_version": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
     )
-    await session.flush()
-    session.add(UserRoleModel(user_id=admin_id, role_id=role.id))
+    await session.execute(insert(UserRoleModel), [{"user_id": admin_id, "role_id": role_id}])
     await session.commit()
 
     return {"email": "admin-users@test.com", "password": "Admin123!"}
 
 
 @pytest.mark.asyncio
-async def test_admin_deactivate_user(client: AsyncClient, session: AsyncSession):
+async def test_admin_deactivate_user(
+    client: AsyncClient, session: AsyncSession, pre_hashed_user: dict, admin_password_hash: str
+):
     """Admin can deactivate a user via PATCH."""
-    admin = await _create_admin_with_permission(session, "users:write")
-
-    # Create target user
-    hasher = Argon2PasswordHasher()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
-    target_user_id = uuid.uuid4()
-    session.add(
-        UserModel(
-            id=target_user_id,
-            email="target@test.com",
-            password_hash=hasher.hash_password("User123!"),
-            is_active=True,
-            is_verified=True,
-            token_version=0,
-            created_at=now,
-            updated_at=now,
-        )
-    )
-    await session.commit()
+    admin = await _create_admin_with_permission(session, "users:write", admin_password_hash)
+    target_user_id = pre_hashed_user["user_id"]
 
     login = await client.post(
         "/auth/login",
@@ -1,18 +1,7 @@
 """Integration tests for authentication endpoints."""
 
-import uuid
-
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.domain.entities.permission import Permission
-from app.domain.entities.role import Role
-from app.infrastructure.db.sqlalchemy.models.permission_model import PermissionModel
-from app.infrastructure.db.sqlalchemy.models.role_model import RoleModel
-from app.infrastructure.db.sqlalchemy.models.role_permission_model import RolePermissionModel
-from app.infrastructure.db.sqlalchemy.models.user_model import UserModel
-from app.infrastructure.db.sqlalchemy.models.user_role_model import UserRoleModel
 
 
 @pytest.mark.asyncio
@@ -80,18 +69,11 @@ async def test_register_duplicate_email(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_login_success(client: AsyncClient):
+async def test_login_success(client: AsyncClient, pre_hashed_user: dict):
     """Test successful login returns access token and sets cookies."""
-    # Register user
-    await client.post(
-        "/auth/register",
-        json={"email": "loginuser@example.com", "password": "SecurePass123"},
-    )
-
-    # Login
     response = await client.post(
         "/auth/login",
-        json={"email": "loginuser@example.com", "password": "SecurePass123"},
+        json={"email": pre_hashed_user["email"], "password": pre_hashed_user["password"]},
     )
 
     assert response.status_code == 200
@@ -105,39 +87,22 @@ async def test_login_success(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_login_invalid_credentials(client: AsyncClient):
+async def test_login_invalid_credentials(client: AsyncClient, pre_hashed_user: dict):
     """Test login with invalid credentials fails."""
-    # Register user
-    await client.post(
-        "/auth/register",
-        json={"email": "user@example.com", "password": "SecurePass123"},
-    )
-
     # Try to login with wrong password
     response = await client.post(
         "/auth/login",
-        json={"email": "user@example.com", "password": "WrongPassword"},
+        json={"email": pre_hashed_user["email"], "password": "WrongPassword"},
     )
 
     assert response.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_refresh_token_rotation(client: AsyncClient):
+async def test_refresh_token_rotation(client: AsyncClient, shared_user: dict):
     """Test refresh token rotation."""
-    # Register and login
-    await client.post(
-        "/auth/register",
-        json={"email": "refresh@example.com", "password": "SecurePass123"},
-    )
-
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "refresh@example.com", "password": "SecurePass123"},
-    )
-
-    old_refresh_token = login_response.cookies["refresh_token"]
-    csrf_token = login_response.cookies["csrf_token"]
+    old_refresh_token = shared_user["refresh_token"]
+    csrf_token = shared_user["csrf_token"]
 
     # Refresh
     refresh_response = await client.post(
@@ -165,20 +130,9 @@ async def test_refresh_token_rotation(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_me(client: AsyncClient):
+async def test_get_me(client: AsyncClient, shared_user: dict):
     """Test getting current user info."""
-    # Register and login
-    await client.post(
-        "/auth/register",
-        json={"email": "me@example.com", "password": "SecurePass123"},
-    )
-
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "me@example.com", "password": "SecurePass123"},
-    )
-
-    access_token = login_response.json()["access_token"]
+    access_token = shared_user["access_token"]
 
     # Get me
     response = await client.get(
@@ -188,26 +142,15 @@ async def test_get_me(client: AsyncClient):
 
     assert response.status_code == 200
     data = response.json()
-    assert data["email"] == "me@example.com"
+    assert data["email"] == shared_user["email"]
     assert data["is_active"] is True
 
 
 @pytest.mark.asyncio
-async def test_logout(client: AsyncClient):
+async def test_logout(client: AsyncClient, shared_user: dict):
     """Test logout revokes refresh token."""
-    # Register and login
-    await client.post(
-        "/auth/register",
-        json={"email": "logout@example.com", "password": "SecurePass123"},
-    )
-
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "logout@example.com", "password": "SecurePass123"},
-    )
-
-    refresh_token = login_response.cookies["refresh_token"]
-    csrf_token = login_response.cookies["csrf_token"]
+    refresh_token = shared_user["refresh_token"]
+    csrf_token = shared_user["csrf_token"]
 
     # Logout
     response = await client.post(
@@ -229,25 +172,14 @@ async def test_logout(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_change_password(client: AsyncClient):
+async def test_change_password(client: AsyncClient, shared_user: dict):
     """Test password change revokes all sessions."""
-    # Register and login
-    await client.post(
-        "/auth/register",
-        json={"email": "changepw@example.com", "password": "SecurePass123"},
-    )
-
-    login_response = await client.post(
-        "/auth/login",
-        json={"email": "changepw@example.com", "password": "SecurePass123"},
-    )
-
-    old_access_token = login_response.json()["access_token"]
+    old_access_token = shared_user["access_token"]
 
     # Change password
     response = await client.post(
         "/auth/change-password",
-        json={"old_password": "SecurePass123", "new_password": "NewSecure456"},
+        json={"old_password": shared_user["password"], "new_password": "NewSecure456"},
         headers={"Authorization": f"Bearer {old_access_token}"},
     )
 
@@ -264,7 +196,7 @@ async def test_change_password(client: AsyncClient):
     # New login should work
     new_login_response = await client.post(
         "/auth/login",
-        json={"email": "changepw@example.com", "password": "NewSecure456"},
+        json={"email": shared_user["email"], "password": "NewSecure456"},
     )
 
     assert new_login_response.status_code == 200
@@ -5,7 +5,7 @@ import datetime as _dt
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.db.sqlalchemy.models.inventory_model import InventoryModel
@@ -79,10 +79,13 @@ async def _grant_permission(session: AsyncSession, user_id: uuid.UUID, permissio
     """Create role+permission and assign to user."""
     role_id = uuid.uuid4()
     perm_id = uuid.uuid4()
-    session.add(RoleModel(id=role_id, name=f"role-{role_id.hex[:6]}"))
-    session.add(PermissionModel(id=perm_id, code=permission_code))
-    session.add(RolePermissionModel(role_id=role_id, permission_id=perm_id))
-    session.add(UserRoleModel(user_id=user_id, role_id=role_id))
+    # Core inserts skip the unit of work; issued in foreign-key order
+    await session.execute(insert(RoleModel), [{"id": role_id, "name": f"role-{role_id.hex[:6]}"}])
+    await session.execute(insert(PermissionModel), [{"id": perm_id, "code": permission_code}])
+    await session.execute(
+        insert(RolePermissionModel), [{"role_id": role_id, "permission_id": perm_id}]
+    )
+    await session.execute(insert(UserRoleModel), [{"user_id": user_id, "role_id": role_id}])
     await session.commit()
 
 
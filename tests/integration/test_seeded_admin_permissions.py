@@ -2,18 +2,20 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.settings import settings
-from scripts.seed_data import seed_data
-from tests.conftest import TEST_DATABASE_URL
+from scripts._seed_common import seed
+from scripts.seed_data import ADMIN_PERMISSION_CODES, USER_PERMISSION_CODES
 
 
 @pytest.mark.asyncio
-async def test_seeded_admin_has_orders_and_rbac_permissions(client: AsyncClient):
+async def test_seeded_admin_has_orders_and_rbac_permissions(
+    client: AsyncClient, session: AsyncSession
+):
     """Seeded admin can access admin orders and RBAC endpoints."""
-    settings.database_url = TEST_DATABASE_URL
-
-    await seed_data()
+    # Seed through the test session so the rows roll back with the test
+    await seed(session, ADMIN_PERMISSION_CODES, USER_PERMISSION_CODES)
+    await session.commit()
 
     login_response = await client.post(
         "/auth/login",
@@ -0,0 +1,53 @@
+"""Shared configuration and fixtures for unit tests."""
+
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+_UNIT_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Mark every unit test ``no_db``.
+
+    Unit tests touch no database, disk or network, so ``-m no_db`` (or
+    ``-m "not no_db"``) splits a whole-tree run into its fast and DB-backed tiers.
+    """
+    for item in items:
+        if _UNIT_DIR in item.path.parents:
+            item.add_marker(pytest.mark.no_db)
+
+
+def _encode_test_image(format: str, width: int = 10, height: int = 10) -> bytes:
+    """Encode a solid red test image in the given Pillow format."""
+    img = Image.new("RGB", (width, height), color="red")
+    buf = io.BytesIO()
+    img.save(buf, format=format)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def png_bytes() -> bytes:
+    """Valid PNG image, encoded once per session."""
+    return _encode_test_image("PNG")
+
+
+@pytest.fixture(scope="session")
+def jpeg_bytes() -> bytes:
+    """Valid JPEG image, encoded once per session."""
+    return _encode_test_image("JPEG")
+
+
+@pytest.fixture(scope="session")
+def webp_bytes() -> bytes:
+    """Valid WebP image, encoded once per session."""
+    return _encode_test_image("WEBP")
+
+
+@pytest.fixture(scope="session")
+def gif_bytes() -> bytes:
+    """Valid GIF image, encoded once per session."""
+    return _encode_test_image("GIF")
@@ -1,11 +1,51 @@
 """Unit tests for Inventory entity."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from uuid import uuid4
 
 from app.domain.entities.inventory import Inventory
 from app.domain.errors.domain_errors import InvalidStockAdjustmentError, InsufficientStockError
 
+# Inventories are immutable and every operation returns a new instance, so
+# tests share these module-scoped fixtures instead of building their own
+
+
+@pytest.fixture(scope="module")
+def base_inventory() -> Inventory:
+    """10 on hand, 2 reserved, no backorder."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=2, allow_backorder=False)
+
+
+@pytest.fixture(scope="module")
+def inventory_unreserved() -> Inventory:
+    """10 on hand, nothing reserved."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=0, allow_backorder=False)
+
+
+@pytest.fixture(scope="module")
+def inventory_half_reserved() -> Inventory:
+    """10 on hand, 5 reserved."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=5, allow_backorder=False)
+
+
+@pytest.fixture(scope="module")
+def inventory_mostly_reserved() -> Inventory:
+    """10 on hand, 8 reserved."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=8, allow_backorder=False)
+
+
+@pytest.fixture(scope="module")
+def inventory_full_reserved() -> Inventory:
+    """10 on hand, all 10 reserved."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=10, allow_backorder=False)
+
+
+@pytest.fixture(scope="module")
+def inventory_backorder() -> Inventory:
+    """10 on hand, 2 reserved, backorders allowed."""
+    return Inventory(variant_id=uuid4(), on_hand=10, reserved=2, allow_backorder=True)
+
 
 class TestInventory:
     """Test cases for Inventory entity."""
@@ -25,265 +65,117 @@ class TestInventory:
         assert inventory.reserved == 2
         assert inventory.allow_backorder is False
 
-    def test_available_property(self):
+    def test_available_property(self, base_inventory):
         """Test that available is computed correctly."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=3,
-            allow_backorder=False,
-        )
+        assert base_inventory.available == 8  # 10 - 2
 
-        assert inventory.available == 7  # 10 - 3
-
-    def test_available_property_zero_reserved(self):
+    def test_available_property_zero_reserved(self, inventory_unreserved):
         """Test available when no reservations."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=0,
-            allow_backorder=False,
-        )
-
-        assert inventory.available == 10
+        assert inventory_unreserved.available == 10
 
-    def test_available_property_all_reserved(self):
+    def test_available_property_all_reserved(self, inventory_full_reserved):
         """Test available when all stock is reserved."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=10,
-            allow_backorder=False,
-        )
+        assert inventory_full_reserved.available == 0
 
-        assert inventory.available == 0
-
-    def test_adjust_on_hand_positive(self):
+    def test_adjust_on_hand_positive(self, base_inventory):
         """Test increasing on_hand stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        updated = inventory.adjust_on_hand(5)
+        updated = base_inventory.adjust_on_hand(5)
 
         assert updated.on_hand == 15
         assert updated.reserved == 2  # Unchanged
 
-    def test_adjust_on_hand_negative(self):
+    def test_adjust_on_hand_negative(self, base_inventory):
         """Test decreasing on_hand stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        updated = inventory.adjust_on_hand(-3)
+        updated = base_inventory.adjust_on_hand(-3)
 
         assert updated.on_hand == 7
         assert updated.reserved == 2
 
-    def test_adjust_on_hand_to_zero(self):
+    def test_adjust_on_hand_to_zero(self, inventory_unreserved):
         """Test adjusting on_hand to exactly zero."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=0,
-            allow_backorder=False,
-        )
-
-        updated = inventory.adjust_on_hand(-10)
+        updated = inventory_unreserved.adjust_on_hand(-10)
 
         assert updated.on_hand == 0
 
-    def test_adjust_on_hand_zero_delta_raises_error(self):
-        """Test that zero delta raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.adjust_on_hand(0)
-
-    def test_adjust_on_hand_insufficient_stock_raises_error(self):
-        """Test that adjusting below zero raises error when backorder not allowed."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.adjust_on_hand(-15)
-
-    def test_adjust_on_hand_negative_with_backorder(self):
+    def test_adjust_on_hand_negative_with_backorder(self, inventory_backorder):
         """Test that negative stock is allowed with backorder."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=True,
-        )
-
-        updated = inventory.adjust_on_hand(-15)
+        updated = inventory_backorder.adjust_on_hand(-15)
 
         assert updated.on_hand == -5
         assert updated.available == -7  # -5 - 2
 
-    def test_reserve_valid_quantity(self):
+    def test_reserve_valid_quantity(self, base_inventory):
         """Test reserving available stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        updated = inventory.reserve(5)
+        updated = base_inventory.reserve(5)
 
         assert updated.on_hand == 10  # Unchanged
         assert updated.reserved == 7  # 2 + 5
         assert updated.available == 3  # 10 - 7
 
-    def test_reserve_all_available(self):
+    def test_reserve_all_available(self, base_inventory):
         """Test reserving all available stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        updated = inventory.reserve(8)
+        updated = base_inventory.reserve(8)
 
         assert updated.on_hand == 10
         assert updated.reserved == 10
         assert updated.available == 0
 
-    def test_reserve_insufficient_available_raises_error(self):
-        """Test that reserving more than available raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=8,
-            allow_backorder=False,
-        )
-
-        # Available = 2, trying to reserve 5
-        with pytest.raises(InsufficientStockError):
-            inventory.reserve(5)
-
-    def test_reserve_zero_raises_error(self):
-        """Test that reserving zero quantity raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.reserve(0)
-
-    def test_reserve_negative_raises_error(self):
-        """Test that reserving negative quantity raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.reserve(-5)
-
-    def test_release_valid_quantity(self):
+    def test_release_valid_quantity(self, inventory_half_reserved):
         """Test releasing reserved stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=5,
-            allow_backorder=False,
-        )
-
-        updated = inventory.release(3)
+        updated = inventory_half_reserved.release(3)
 
         assert updated.on_hand == 10  # Unchanged
         assert updated.reserved == 2  # 5 - 3
         assert updated.available == 8  # 10 - 2
 
-    def test_release_all_reserved(self):
+    def test_release_all_reserved(self, inventory_half_reserved):
         """Test releasing all reserved stock."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=5,
-            allow_backorder=False,
-        )
-
-        updated = inventory.release(5)
+        updated = inventory_half_reserved.release(5)
 
         assert updated.on_hand == 10
         assert updated.reserved == 0
         assert updated.available == 10
 
-    def test_release_more_than_reserved_raises_error(self):
-        """Test that releasing more than reserved raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=5,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.release(7)
-
-    def test_release_zero_raises_error(self):
-        """Test that releasing zero quantity raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=5,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.release(0)
-
-    def test_release_negative_raises_error(self):
-        """Test that releasing negative quantity raises error."""
-        inventory = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=5,
-            allow_backorder=False,
-        )
-
-        with pytest.raises(InvalidStockAdjustmentError):
-            inventory.release(-2)
-
-    def test_inventory_immutability(self):
+    @pytest.mark.parametrize(
+        ("inventory_fixture", "operation", "quantity", "error"),
+        [
+            ("base_inventory", "adjust_on_hand", 0, InvalidStockAdjustmentError),
+            ("base_inventory", "adjust_on_hand", -15, InvalidStockAdjustmentError),
+            ("inventory_mostly_reserved", "reserve", 5, InsufficientStockError),
+            ("base_inventory", "reserve", 0, InvalidStockAdjustmentError),
+            ("base_inventory", "reserve", -5, InvalidStockAdjustmentError),
+            ("inventory_half_reserved", "release", 7, InvalidStockAdjustmentError),
+            ("inventory_half_reserved", "release", 0, InvalidStockAdjustmentError),
+            ("inventory_half_reserved", "release", -2, InvalidStockAdjustmentError),
+        ],
+        ids=[
+            "adjust-zero",
+            "adjust-below-zero",
+            "reserve-too-many",
+            "reserve-zero",
+            "reserve-negative",
+            "release-too-many",
+            "release-zero",
+            "release-negative",
+        ],
+    )
+    def test_invalid_operation_raises_error(
+        self, request, inventory_fixture, operation, quantity, error
+    ):
+        """Test that invalid adjust/reserve/release quantities raise errors."""
+        inventory = request.getfixturevalue(inventory_fixture)
+        with pytest.raises(error):
+            getattr(inventory, operation)(quantity)
+
+    def test_inventory_immutability(self, base_inventory):
         """Test that inventory operations return new instances."""
-        original = Inventory(
-            variant_id=uuid4(),
-            on_hand=10,
-            reserved=2,
-            allow_backorder=False,
-        )
-
-        updated = original.adjust_on_hand(5)
+        updated = base_inventory.adjust_on_hand(5)
 
         # Original unchanged
-        assert original.on_hand == 10
+        assert base_inventory.on_hand == 10
         # New instance created
         assert updated.on_hand == 15
-        assert updated is not original
-
+        assert updated is not base_inventory
+        # Fields cannot be reassigned in place
+        with pytest.raises(FrozenInstanceError):
+            base_inventory.on_hand = 0
@@ -0,0 +1,53 @@
+"""Shared fixtures for domain policy tests."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.product import Product, ProductStatus
+from app.domain.entities.product_variant import ProductVariant, VariantStatus
+from app.domain.value_objects.money import Money
+from app.domain.value_objects.sku import SKU
+from app.domain.value_objects.slug import Slug
+
+
+@pytest.fixture(scope="module")
+def base_product() -> Product:
+    """Valid draft product; entities are frozen, so tests derive variations with ``replace``."""
+    now = datetime.now(timezone.utc)
+    return Product(
+        id=uuid4(),
+        name="Test Product",
+        slug=Slug("test-product"),
+        description_short=None,
+        description_long=None,
+        status=ProductStatus.DRAFT,
+        tags=[],
+        featured=False,
+        sort_order=0,
+        created_at=now,
+        updated_at=now,
+        created_by=uuid4(),
+        updated_by=uuid4(),
+    )
+
+
+@pytest.fixture(scope="module")
+def base_variant(base_product: Product) -> ProductVariant:
+    """Valid active default variant of ``base_product``."""
+    return ProductVariant(
+        id=uuid4(),
+        product_id=base_product.id,
+        sku=SKU.from_string("TEST-SKU"),
+        barcode=None,
+        status=VariantStatus.ACTIVE,
+        price=Money(amount=1000, currency="USD"),
+        compare_at_price=None,
+        cost=None,
+        color_id=None,
+        size_id=None,
+        is_default=True,
+        created_at=base_product.created_at,
+        updated_at=base_product.updated_at,
+    )
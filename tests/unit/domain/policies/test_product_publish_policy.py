@@ -1,316 +1,91 @@
 """Unit tests for ProductPublishPolicy."""
 
 import pytest
+from dataclasses import dataclass, field, replace
 from uuid import uuid4
-from datetime import datetime, timezone
 
-from app.domain.entities.product import Product, ProductStatus
+from app.domain.entities.product import Product
 from app.domain.entities.product_variant import ProductVariant, VariantStatus
-from app.domain.value_objects.slug import Slug
 from app.domain.value_objects.sku import SKU
 from app.domain.value_objects.money import Money
 from app.domain.policies.product_publish_policy import ProductPublishPolicy
 
 
-class TestProductPublishPolicy:
-    """Test cases for ProductPublishPolicy."""
-
-    def test_can_publish_valid_product(self):
-        """Test that a valid product can be published."""
-        product_id = uuid4()
-        product = Product(
-            id=product_id,
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short="Test",
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        variant = ProductVariant(
-            id=uuid4(),
-            product_id=product_id,
-            sku=SKU.from_string("TEST-SKU"),
-            barcode=None,
-            status=VariantStatus.ACTIVE,
-            price=Money(amount=1000, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
-            is_default=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+@dataclass(frozen=True)
+class _RejectCase:
+    """A product/variant combination that must not be publishable."""
 
-        can_publish, reason = ProductPublishPolicy.can_publish(
-            product, [(variant, variant.status, True)]
-        )
-
-        assert can_publish is True
-        assert reason is None
+    name: str
+    reason: str
+    product_overrides: dict = field(default_factory=dict)
+    # (variant overrides, has valid price and SKU) per variant
+    variants: tuple[tuple[dict, bool], ...] = ()
 
-    def test_cannot_publish_without_name(self):
-        """Test that product without name cannot be published."""
-        product = Product(
-            id=uuid4(),
-            name="",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
 
-        can_publish, reason = ProductPublishPolicy.can_publish(product, [])
+_REJECT_CASES = [
+    _RejectCase("without_name", "name", product_overrides={"name": ""}),
+    _RejectCase("without_slug", "slug", product_overrides={"slug": None}),
+    _RejectCase("without_active_variants", "variant"),
+    _RejectCase(
+        "with_only_inactive_variants",
+        "active",
+        variants=(({"status": VariantStatus.INACTIVE}, True),),
+    ),
+    _RejectCase("with_variant_missing_sku", "sku", variants=(({}, False),)),
+    _RejectCase("with_variant_missing_price", "price", variants=(({}, False),)),
+]
 
-        assert can_publish is False
-        assert "name" in reason.lower()
 
-    def test_cannot_publish_without_slug(self):
-        """Test that product without slug cannot be published."""
-        product = Product(
-            id=uuid4(),
-            name="Test Product",
-            slug=None,
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        can_publish, reason = ProductPublishPolicy.can_publish(product, [])
-
-        assert can_publish is False
-        assert "slug" in reason.lower()
-
-    def test_cannot_publish_without_active_variants(self):
-        """Test that product without active variants cannot be published."""
-        product = Product(
-            id=uuid4(),
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        can_publish, reason = ProductPublishPolicy.can_publish(product, [])
-
-        assert can_publish is False
-        assert "variant" in reason.lower()
-
-    def test_cannot_publish_with_only_inactive_variants(self):
-        """Test that product with only inactive variants cannot be published."""
-        product_id = uuid4()
-        product = Product(
-            id=product_id,
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        inactive_variant = ProductVariant(
-            id=uuid4(),
-            product_id=product_id,
-            sku=SKU.from_string("TEST-SKU"),
-            barcode=None,
-            status=VariantStatus.INACTIVE,
-            price=Money(amount=1000, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
-            is_default=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        can_publish, reason = ProductPublishPolicy.can_publish(
-            product, [(inactive_variant, inactive_variant.status, True)]
-        )
-
-        assert can_publish is False
-        assert "active" in reason.lower()
-
-    def test_cannot_publish_with_variant_missing_sku(self):
-        """Test that product with variant missing SKU cannot be published."""
-        product_id = uuid4()
-        product = Product(
-            id=product_id,
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        variant = ProductVariant(
-            id=uuid4(),
-            product_id=product_id,
-            sku=SKU.from_string("TEST-SKU"),
-            barcode=None,
-            status=VariantStatus.ACTIVE,
-            price=Money(amount=1000, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
-            is_default=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+class TestProductPublishPolicy:
+    """Test cases for ProductPublishPolicy."""
 
+    def test_can_publish_valid_product(
+        self, base_product: Product, base_variant: ProductVariant
+    ):
+        """Test that a valid product can be published."""
         can_publish, reason = ProductPublishPolicy.can_publish(
-            product, [(variant, variant.status, False)]
+            base_product, [(base_variant, base_variant.status, True)]
         )
 
-        assert can_publish is False
-        assert "sku" in reason.lower()
+        assert can_publish is True
+        assert reason is None
 
-    def test_cannot_publish_with_variant_missing_price(self):
-        """Test that product with variant missing price cannot be published."""
-        product_id = uuid4()
-        product = Product(
-            id=product_id,
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
+    @pytest.mark.parametrize("case", _REJECT_CASES, ids=[case.name for case in _REJECT_CASES])
+    def test_cannot_publish(
+        self, case: _RejectCase, base_product: Product, base_variant: ProductVariant
+    ):
+        """Test that an incomplete product cannot be published, with the reason."""
+        product = replace(base_product, **case.product_overrides)
+        variants = []
+        for overrides, has_valid_pricing in case.variants:
+            variant = replace(base_variant, **overrides)
+            variants.append((variant, variant.status, has_valid_pricing))
 
-        variant = ProductVariant(
-            id=uuid4(),
-            product_id=product_id,
-            sku=SKU.from_string("TEST-SKU"),
-            barcode=None,
-            status=VariantStatus.ACTIVE,
-            price=Money(amount=1000, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
-            is_default=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        can_publish, reason = ProductPublishPolicy.can_publish(
-            product, [(variant, variant.status, False)]
-        )
+        can_publish, reason = ProductPublishPolicy.can_publish(product, variants)
 
         assert can_publish is False
-        assert "price" in reason.lower()
+        assert case.reason in reason.lower()
 
-    def test_can_publish_with_multiple_variants_some_active(self):
+    def test_can_publish_with_multiple_variants_some_active(
+        self, base_product: Product, base_variant: ProductVariant
+    ):
         """Test that product can be published if at least one variant is valid and active."""
-        product_id = uuid4()
-        product = Product(
-            id=product_id,
-            name="Test Product",
-            slug=Slug("test-product"),
-            description_short=None,
-            description_long=None,
-            status=ProductStatus.DRAFT,
-            tags=[],
-            featured=False,
-            sort_order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-            created_by=uuid4(),
-            updated_by=uuid4(),
-        )
-
-        active_variant = ProductVariant(
+        inactive_variant = replace(
+            base_variant,
             id=uuid4(),
-            product_id=product_id,
-            sku=SKU.from_string("TEST-SKU-1"),
-            barcode=None,
-            status=VariantStatus.ACTIVE,
-            price=Money(amount=1000, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
-            is_default=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        inactive_variant = ProductVariant(
-            id=uuid4(),
-            product_id=product_id,
             sku=SKU.from_string("TEST-SKU-2"),
-            barcode=None,
             status=VariantStatus.INACTIVE,
             price=Money(amount=1500, currency="USD"),
-            compare_at_price=None,
-            cost=None,
-            color_id=None,
-            size_id=None,
             is_default=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
 
         can_publish, reason = ProductPublishPolicy.can_publish(
-            product,
+            base_product,
             [
-                (active_variant, active_variant.status, True),
+                (base_variant, base_variant.status, True),
                 (inactive_variant, inactive_variant.status, True),
             ],
         )
 
         assert can_publish is True
         assert reason is None
-
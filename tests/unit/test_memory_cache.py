@@ -1,273 +1,258 @@
 """Unit tests for MemoryCache implementation."""
 
-from datetime import datetime, timedelta
-from unittest.mock import patch
-
 import pytest
 
-from app.infrastructure.caching.memory_cache import MemoryCache
+from app.infrastructure.caching.memory_cache import AsyncMemoryCache, MemoryCache
 
+_NS_PER_SECOND = 1_000_000_000
 
-@pytest.mark.asyncio
-async def test_get_non_existent_key():
+
+class _FrozenMonotonicClock:
+    """Cache clock that only moves when ticked."""
+
+    def __init__(self, now_ns: int = 0) -> None:
+        self.now_ns = now_ns
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def tick(self, seconds: int) -> None:
+        self.now_ns += seconds * _NS_PER_SECOND
+
+
+def test_get_non_existent_key():
     """Test getting a non-existent key returns None."""
     cache = MemoryCache()
-    result = await cache.get("non_existent")
+    result = cache.get("non_existent")
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_set_and_get():
+def test_set_and_get():
     """Test setting and getting a value."""
     cache = MemoryCache()
-    await cache.set("test_key", "test_value", 60)
-    result = await cache.get("test_key")
+    cache.set("test_key", "test_value", 60)
+    result = cache.get("test_key")
     assert result == "test_value"
 
 
-@pytest.mark.asyncio
-async def test_get_expired_key():
+def test_get_expired_key():
     """Test getting an expired key returns None and removes it."""
-    cache = MemoryCache()
+    clock = _FrozenMonotonicClock()
+    cache = MemoryCache(clock=clock)
     
     # Set with very short TTL
-    await cache.set("expired_key", "value", 1)
-    
-    # Mock time to be past expiration
-    with patch("app.infrastructure.caching.memory_cache.datetime") as mock_datetime:
-        # First call returns current time (for set operation if cached)
-        # Second call returns future time (for get operation)
-        future_time = datetime.utcnow() + timedelta(seconds=10)
-        mock_datetime.utcnow.return_value = future_time
-        
-        result = await cache.get("expired_key")
-        assert result is None
-        
-        # Verify key was removed
-        assert "expired_key" not in cache._cache
+    cache.set("expired_key", "value", 1)
+    
+    # Advance time past expiration
+    clock.tick(10)
+    
+    result = cache.get("expired_key")
+    assert result is None
+    
+    # Verify key was removed
+    assert "expired_key" not in cache._cache
 
 
-@pytest.mark.asyncio
-async def test_delete():
+def test_delete():
     """Test deleting a key."""
     cache = MemoryCache()
-    await cache.set("key_to_delete", "value", 60)
+    cache.set("key_to_delete", "value", 60)
     
     # Verify key exists
-    assert await cache.get("key_to_delete") == "value"
+    assert cache.get("key_to_delete") == "value"
     
     # Delete key
-    await cache.delete("key_to_delete")
+    cache.delete("key_to_delete")
     
     # Verify key no longer exists
-    assert await cache.get("key_to_delete") is None
+    assert cache.get("key_to_delete") is None
 
 
-@pytest.mark.asyncio
-async def test_delete_non_existent_key():
+def test_delete_non_existent_key():
     """Test deleting a non-existent key doesn't raise error."""
     cache = MemoryCache()
-    await cache.delete("non_existent")  # Should not raise
+    cache.delete("non_existent")  # Should not raise
 
 
-@pytest.mark.asyncio
-async def test_clear():
+def test_clear():
     """Test clearing all cache entries."""
     cache = MemoryCache()
-    await cache.set("key1", "value1", 60)
-    await cache.set("key2", "value2", 60)
-    await cache.set("key3", "value3", 60)
+    cache.set("key1", "value1", 60)
+    cache.set("key2", "value2", 60)
+    cache.set("key3", "value3", 60)
     
     # Verify keys exist
-    assert await cache.get("key1") == "value1"
-    assert await cache.get("key2") == "value2"
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") == "value2"
     
     # Clear cache
-    await cache.clear()
+    cache.clear()
     
     # Verify all keys gone
-    assert await cache.get("key1") is None
-    assert await cache.get("key2") is None
-    assert await cache.get("key3") is None
-
-
-@pytest.mark.asyncio
-async def test_delete_pattern_wildcard_suffix():
-    """Test delete_pattern with wildcard suffix (e.g., 'products:*')."""
+    assert cache.get("key1") is None
+    assert cache.get("key2") is None
+    assert cache.get("key3") is None
+
+
+# (keys set with a 60s TTL, pattern, keys expected to survive)
+_DELETE_PATTERN_CASES = {
+    "wildcard_suffix": (
+        ["products:1", "products:2", "products:storefront:list", "users:1", "category:1"],
+        "products:*",
+        {"users:1", "category:1"},
+    ),
+    "wildcard_prefix": (
+        ["products:storefront:1", "products:storefront:2", "products:admin:1"],
+        "products:storefront:*",
+        {"products:admin:1"},
+    ),
+    "exact_match": (["exact:key", "exact:key:other"], "exact:key", {"exact:key:other"}),
+    # ? matches a single character, so the two-digit id survives
+    "question_mark": (["user:1", "user:2", "user:10"], "user:?", {"user:10"}),
+    "no_matches": (["products:1", "users:1"], "categories:*", {"products:1", "users:1"}),
+    "brackets": (["item:a", "item:b", "item:c", "item:d"], "item:[ab]", {"item:c", "item:d"}),
+    "empty_cache": ([], "any:*", set()),
+}
+
+
+@pytest.mark.parametrize(
+    ("keys", "pattern", "survivors"),
+    list(_DELETE_PATTERN_CASES.values()),
+    ids=list(_DELETE_PATTERN_CASES),
+)
+def test_delete_pattern(keys, pattern, survivors):
+    """Test delete_pattern removes exactly the keys matching the glob pattern."""
     cache = MemoryCache()
+    for key in keys:
+        cache.set(key, f"value-{key}", 60)
     
-    # Set up test data
-    await cache.set("products:1", "product1", 60)
-    await cache.set("products:2", "product2", 60)
-    await cache.set("products:storefront:list", "list", 60)
-    await cache.set("users:1", "user1", 60)
-    await cache.set("category:1", "cat1", 60)
+    cache.delete_pattern(pattern)
     
-    # Delete pattern
-    await cache.delete_pattern("products:*")
-    
-    # Verify products keys deleted
-    assert await cache.get("products:1") is None
-    assert await cache.get("products:2") is None
-    assert await cache.get("products:storefront:list") is None
-    
-    # Verify other keys remain
-    assert await cache.get("users:1") == "user1"
-    assert await cache.get("category:1") == "cat1"
+    assert set(cache._cache) == survivors
+    for key in survivors:
+        assert cache.get(key) == f"value-{key}"
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_wildcard_prefix():
-    """Test delete_pattern with wildcard prefix."""
-    cache = MemoryCache()
+def test_delete_pattern_purges_expired_keys():
+    """Test that delete_pattern also removes expired keys."""
+    clock = _FrozenMonotonicClock()
+    cache = MemoryCache(clock=clock)
+    
+    # Set up mix of valid and expired keys
+    cache.set("products:1", "p1", 60)
+    cache.set("products:2", "p2", 1)  # Short TTL
+    cache.set("users:1", "u1", 1)  # Short TTL, different prefix
     
-    await cache.set("products:storefront:1", "p1", 60)
-    await cache.set("products:storefront:2", "p2", 60)
-    await cache.set("products:admin:1", "a1", 60)
+    # Advance time to expire some keys
+    clock.tick(10)
     
-    # Delete only storefront
-    await cache.delete_pattern("products:storefront:*")
+    # Delete products pattern - should also clean up expired keys
+    cache.delete_pattern("products:*")
     
-    assert await cache.get("products:storefront:1") is None
-    assert await cache.get("products:storefront:2") is None
-    assert await cache.get("products:admin:1") == "a1"
+    # Both products keys deleted (one by pattern, one expired)
+    assert cache.get("products:1") is None
+    assert cache.get("products:2") is None
+    
+    # Expired users key also removed during scan
+    assert "users:1" not in cache._cache
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_exact_match():
-    """Test delete_pattern with exact key (no wildcards)."""
-    cache = MemoryCache()
+def test_delete_pattern_keeps_key_refreshed_with_longer_ttl():
+    """Test that an expired TTL superseded by a later set() does not purge the key."""
+    clock = _FrozenMonotonicClock()
+    cache = MemoryCache(clock=clock)
+    
+    cache.set("products:1", "old", 1)
+    cache.set("products:1", "new", 60)
     
-    await cache.set("exact:key", "value", 60)
-    await cache.set("exact:key:other", "other", 60)
+    clock.tick(10)
     
-    # Delete exact pattern
-    await cache.delete_pattern("exact:key")
+    cache.delete_pattern("users:*")
     
-    assert await cache.get("exact:key") is None
-    assert await cache.get("exact:key:other") == "other"
+    assert cache.get("products:1") == "new"
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_question_mark():
-    """Test delete_pattern with ? wildcard (single character)."""
-    cache = MemoryCache()
+def test_delete_pattern_all_expired():
+    """Test delete_pattern when all matching keys are expired."""
+    clock = _FrozenMonotonicClock()
+    cache = MemoryCache(clock=clock)
     
-    await cache.set("user:1", "u1", 60)
-    await cache.set("user:2", "u2", 60)
-    await cache.set("user:10", "u10", 60)
+    cache.set("products:1", "p1", 1)
+    cache.set("products:2", "p2", 1)
     
-    # Match single digit
-    await cache.delete_pattern("user:?")
+    # Advance time to expire all keys
+    clock.tick(10)
     
-    assert await cache.get("user:1") is None
-    assert await cache.get("user:2") is None
-    assert await cache.get("user:10") == "u10"  # Two chars, not matched
+    cache.delete_pattern("products:*")
+    
+    # All keys removed
+    assert len(cache._cache) == 0
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_no_matches():
-    """Test delete_pattern when no keys match."""
-    cache = MemoryCache()
+def test_ttl_behavior():
+    """Test that TTL is correctly calculated and enforced."""
+    clock = _FrozenMonotonicClock()
+    cache = MemoryCache(clock=clock)
     
-    await cache.set("products:1", "p1", 60)
-    await cache.set("users:1", "u1", 60)
+    # Set with 60 second TTL
+    cache.set("key", "value", 60)
     
-    # Delete pattern with no matches
-    await cache.delete_pattern("categories:*")
+    # Verify value is retrievable before expiration
+    clock.tick(30)
+    assert cache.get("key") == "value"
     
-    # All keys should remain
-    assert await cache.get("products:1") == "p1"
-    assert await cache.get("users:1") == "u1"
+    # Verify value expires after TTL
+    clock.tick(31)
+    assert cache.get("key") is None
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_purges_expired_keys():
-    """Test that delete_pattern also removes expired keys."""
-    cache = MemoryCache()
+def test_expiry_heap_stays_bounded_under_churn():
+    """Test that deletes and overwrites within the TTL do not grow the expiry heap."""
+    cache = MemoryCache(clock=_FrozenMonotonicClock())
+    cache.set("live", "value", 300)
     
-    # Set up mix of valid and expired keys
-    await cache.set("products:1", "p1", 60)
-    await cache.set("products:2", "p2", 1)  # Short TTL
-    await cache.set("users:1", "u1", 1)  # Short TTL, different prefix
-    
-    # Mock time to expire some keys
-    with patch("app.infrastructure.caching.memory_cache.datetime") as mock_datetime:
-        future_time = datetime.utcnow() + timedelta(seconds=10)
-        mock_datetime.utcnow.return_value = future_time
-        
-        # Delete products pattern - should also clean up expired keys
-        await cache.delete_pattern("products:*")
-        
-        # Both products keys deleted (one by pattern, one expired)
-        assert await cache.get("products:1") is None
-        assert await cache.get("products:2") is None
-        
-        # Expired users key also removed during scan
-        assert "users:1" not in cache._cache
+    for i in range(10_000):
+        cache.set("churn", i, 300)
+        cache.delete("churn")
+        cache.set("overwritten", i, 300)
+    
+    assert set(cache._cache) == {"live", "overwritten"}
+    assert len(cache._expiry) <= 2 * len(cache._cache)
+    assert cache.get("overwritten") == 9_999
 
 
-@pytest.mark.asyncio
-async def test_delete_pattern_empty_cache():
-    """Test delete_pattern on empty cache."""
-    cache = MemoryCache()
-    await cache.delete_pattern("any:*")  # Should not raise
+def test_expiry_heap_shrinks_after_deletes():
+    """Test that deleting most keys compacts the expiry heap without further writes."""
+    cache = MemoryCache(clock=_FrozenMonotonicClock())
+    for i in range(1_000):
+        cache.set(f"key:{i}", i, 300)
 
+    for i in range(1, 1_000):
+        cache.delete(f"key:{i}")
+    assert len(cache._expiry) <= 2 * len(cache._cache)
 
-@pytest.mark.asyncio
-async def test_delete_pattern_all_expired():
-    """Test delete_pattern when all matching keys are expired."""
-    cache = MemoryCache()
-    
-    await cache.set("products:1", "p1", 1)
-    await cache.set("products:2", "p2", 1)
-    
-    # Mock time to expire all keys
-    with patch("app.infrastructure.caching.memory_cache.datetime") as mock_datetime:
-        future_time = datetime.utcnow() + timedelta(seconds=10)
-        mock_datetime.utcnow.return_value = future_time
-        
-        await cache.delete_pattern("products:*")
-        
-        # All keys removed
-        assert len(cache._cache) == 0
+    cache.delete_pattern("key:*")
+    assert cache._cache == {}
+    assert cache._expiry == []
 
 
 @pytest.mark.asyncio
-async def test_ttl_behavior():
-    """Test that TTL is correctly calculated and enforced."""
+async def test_async_adapter_delegates_to_cache():
+    """Test that the CachePort adapter reads and writes the wrapped cache."""
     cache = MemoryCache()
+    adapter = AsyncMemoryCache(cache)
     
-    with patch("app.infrastructure.caching.memory_cache.datetime") as mock_datetime:
-        start_time = datetime(2024, 1, 1, 12, 0, 0)
-        mock_datetime.utcnow.return_value = start_time
-        
-        # Set with 60 second TTL
-        await cache.set("key", "value", 60)
-        
-        # Verify value is retrievable before expiration
-        mock_datetime.utcnow.return_value = start_time + timedelta(seconds=30)
-        assert await cache.get("key") == "value"
-        
-        # Verify value expires after TTL
-        mock_datetime.utcnow.return_value = start_time + timedelta(seconds=61)
-        assert await cache.get("key") is None
-
-
-@pytest.mark.asyncio
-async def test_pattern_with_brackets():
-    """Test delete_pattern with bracket character classes."""
-    cache = MemoryCache()
+    await adapter.set("products:1", "p1", 60)
+    await adapter.set("users:1", "u1", 60)
+    assert cache.get("products:1") == "p1"
+    assert await adapter.get("users:1") == "u1"
     
-    await cache.set("item:a", "a", 60)
-    await cache.set("item:b", "b", 60)
-    await cache.set("item:c", "c", 60)
-    await cache.set("item:d", "d", 60)
+    await adapter.delete_pattern("products:*")
+    assert await adapter.get("products:1") is None
     
-    # Match only a and b
-    await cache.delete_pattern("item:[ab]")
+    await adapter.delete("users:1")
+    assert cache.get("users:1") is None
     
-    assert await cache.get("item:a") is None
-    assert await cache.get("item:b") is None
-    assert await cache.get("item:c") == "c"
-    assert await cache.get("item:d") == "d"
+    await adapter.set("key", "value", 60)
+    await adapter.clear()
+    assert cache.get("key") is None
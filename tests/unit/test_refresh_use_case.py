@@ -1,17 +1,14 @@
 """Unit tests for RefreshUseCase."""
 
 import uuid
+from dataclasses import replace
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from app.application.dto.auth_dto import RefreshRequest
-from app.application.interfaces.uow import UnitOfWork
-from app.application.ports.audit_log_port import AuditLogPort
-from app.application.ports.clock_port import ClockPort
-from app.application.ports.crypto_port import TokenHasherPort
-from app.application.ports.jwt_port import JwtPort
 from app.application.use_cases.auth.refresh import RefreshUseCase
 from app.domain.entities.refresh_token import RefreshToken
 from app.domain.entities.user import User
@@ -20,17 +17,50 @@ from app.domain.errors.domain_errors import (
     RefreshTokenReuseDetectedError,
 )
 from app.domain.value_objects.email import Email
-from tests.conftest import FakeClock
+
+# Same instant as the fake_clock fixture
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Active user and its live, unreplaced refresh token; tests derive their own
+# with dataclasses.replace
+_USER = User(
+    id=uuid.uuid4(),
+    first_name=None,
+    last_name=None,
+    email=Email("user@example.com"),
+    password_hash="hash",
+    is_active=True,
+    is_verified=True,
+    token_version=1,
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+_TOKEN = RefreshToken(
+    id=uuid.uuid4(),
+    user_id=_USER.id,
+    token_hash="old_token_hash",
+    family_id=uuid.uuid4(),
+    issued_at=_NOW,
+    expires_at=_NOW + timedelta(days=14),
+    revoked_at=None,
+    replaced_by_token_id=None,
+)
 
 
 class MockUnitOfWork:
     """Mock Unit of Work for testing."""
 
     def __init__(self):
-        self.users = AsyncMock()
-        self.auth = AsyncMock()
-        self.refresh_tokens = AsyncMock()
-        self.rbac = AsyncMock()
+        # Only the repository methods RefreshUseCase calls
+        self.users = SimpleNamespace(get_by_id=AsyncMock(), update=AsyncMock())
+        self.auth = SimpleNamespace(get_user_roles=AsyncMock())
+        self.refresh_tokens = SimpleNamespace(
+            get_by_token_hash=AsyncMock(),
+            save=AsyncMock(),
+            update=AsyncMock(),
+            revoke_family=AsyncMock(),
+        )
         self.committed = False
 
     async def __aenter__(self):
@@ -48,55 +78,31 @@ class MockUnitOfWork:
 
 
 @pytest.mark.asyncio
-async def test_refresh_success():
+async def test_refresh_success(fake_clock):
     """Test successful token refresh."""
     # Arrange
-    user_id = uuid.uuid4()
-    family_id = uuid.uuid4()
-    now = datetime(2024, 1, 1, 12, 0, 0)
-
-    user = User(
-        id=user_id,
-        email=Email("user@example.com"),
-        password_hash="hash",
-        is_active=True,
-        is_verified=True,
-        token_version=1,
-        created_at=now,
-        updated_at=now,
-    )
-
-    old_token = RefreshToken(
-        id=uuid.uuid4(),
-        user_id=user_id,
-        token_hash="old_token_hash",
-        family_id=family_id,
-        issued_at=now,
-        expires_at=now + timedelta(days=14),
-        revoked_at=None,
-        replaced_by_token_id=None,
-    )
+    user = replace(_USER, id=uuid.uuid4())
+    old_token = replace(_TOKEN, id=uuid.uuid4(), user_id=user.id, family_id=uuid.uuid4())
 
     uow = MockUnitOfWork()
     uow.refresh_tokens.get_by_token_hash.return_value = old_token
     uow.users.get_by_id.return_value = user
-    uow.auth.get_user_roles.return_value = ["user"]
+    uow.auth.get_user_roles.return_value = [SimpleNamespace(name="user")]
 
-    token_hasher = Mock(spec=TokenHasherPort)
+    token_hasher = Mock()
     token_hasher.hash_token.side_effect = lambda t: f"{t}_hashed"
     token_hasher.generate_token.return_value = "new_raw_token"
 
-    jwt_service = Mock(spec=JwtPort)
+    jwt_service = Mock()
     jwt_service.issue_access_token.return_value = "new_access_token"
 
-    clock = FakeClock(now)
-    audit_log = AsyncMock(spec=AuditLogPort)
+    audit_log = Mock(log_event=AsyncMock())
 
     use_case = RefreshUseCase(
         uow=uow,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
-        clock=clock,
+        clock=fake_clock,
         audit_log=audit_log,
     )
 
@@ -114,33 +120,19 @@ async def test_refresh_success():
 
 
 @pytest.mark.asyncio
-async def test_refresh_token_reuse_detected():
+async def test_refresh_token_reuse_detected(fake_clock):
     """Test token reuse detection revokes family and bumps token version."""
     # Arrange
-    user_id = uuid.uuid4()
     family_id = uuid.uuid4()
-    now = datetime(2024, 1, 1, 12, 0, 0)
-
-    user = User(
-        id=user_id,
-        email=Email("user@example.com"),
-        password_hash="hash",
-        is_active=True,
-        is_verified=True,
-        token_version=1,
-        created_at=now,
-        updated_at=now,
-    )
+    now = fake_clock.now()
 
+    user = replace(_USER, id=uuid.uuid4())
     # Token that has already been replaced (reuse!)
-    old_token = RefreshToken(
+    old_token = replace(
+        _TOKEN,
         id=uuid.uuid4(),
-        user_id=user_id,
-        token_hash="old_token_hash",
+        user_id=user.id,
         family_id=family_id,
-        issued_at=now,
-        expires_at=now + timedelta(days=14),
-        revoked_at=None,
         replaced_by_token_id=uuid.uuid4(),  # Already replaced!
     )
 
@@ -148,18 +140,17 @@ async def test_refresh_token_reuse_detected():
     uow.refresh_tokens.get_by_token_hash.return_value = old_token
     uow.users.get_by_id.return_value = user
 
-    token_hasher = Mock(spec=TokenHasherPort)
+    token_hasher = Mock()
     token_hasher.hash_token.return_value = "old_token_hash"
 
-    jwt_service = Mock(spec=JwtPort)
-    clock = FakeClock(now)
-    audit_log = AsyncMock(spec=AuditLogPort)
+    jwt_service = Mock()
+    audit_log = Mock(log_event=AsyncMock())
 
     use_case = RefreshUseCase(
         uow=uow,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
-        clock=clock,
+        clock=fake_clock,
         audit_log=audit_log,
     )
 
@@ -178,39 +169,35 @@ async def test_refresh_token_reuse_detected():
 
 
 @pytest.mark.asyncio
-async def test_refresh_expired_token():
+async def test_refresh_expired_token(fake_clock):
     """Test refreshing expired token fails."""
     # Arrange
-    user_id = uuid.uuid4()
-    now = datetime(2024, 1, 1, 12, 0, 0)
+    now = fake_clock.now()
 
     # Expired token
-    old_token = RefreshToken(
+    old_token = replace(
+        _TOKEN,
         id=uuid.uuid4(),
-        user_id=user_id,
-        token_hash="old_token_hash",
+        user_id=uuid.uuid4(),
         family_id=uuid.uuid4(),
         issued_at=now - timedelta(days=15),
         expires_at=now - timedelta(days=1),  # Expired yesterday
-        revoked_at=None,
-        replaced_by_token_id=None,
     )
 
     uow = MockUnitOfWork()
     uow.refresh_tokens.get_by_token_hash.return_value = old_token
 
-    token_hasher = Mock(spec=TokenHasherPort)
+    token_hasher = Mock()
     token_hasher.hash_token.return_value = "old_token_hash"
 
-    jwt_service = Mock(spec=JwtPort)
-    clock = FakeClock(now)
-    audit_log = AsyncMock(spec=AuditLogPort)
+    jwt_service = Mock()
+    audit_log = Mock(log_event=AsyncMock())
 
     use_case = RefreshUseCase(
         uow=uow,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
-        clock=clock,
+        clock=fake_clock,
         audit_log=audit_log,
     )
 
@@ -1,17 +1,15 @@
 """Unit tests for upload product image use case."""
 
-import io
 import uuid
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from PIL import Image
 
 from app.application.dto.product_dto import ProductImageDTO, UploadProductImageRequest
 from app.application.errors.app_errors import (
     ImageProcessingError,
-    ImageUploadError,
     ResourceNotFoundError,
     ValidationError,
 )
@@ -23,13 +21,25 @@ from app.domain.entities.product import Product, ProductStatus
 from app.domain.value_objects.slug import Slug
 
 
-def create_test_image_bytes(width: int = 100, height: int = 100) -> bytes:
-    """Create a test image as bytes."""
-    img = Image.new('RGB', (width, height), color='red')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='PNG')
-    img_bytes.seek(0)
-    return img_bytes.read()
+# Valid draft product; tests derive their own with dataclasses.replace
+_PRODUCT = Product(
+    id=uuid.uuid4(),
+    name="Test Product",
+    slug=Slug("test-product"),
+    status=ProductStatus.DRAFT,
+    description_short=None,
+    description_long=None,
+    tags=[],
+    featured=False,
+    sort_order=0,
+    created_at=datetime(2024, 1, 1),
+    updated_at=datetime(2024, 1, 1),
+    created_by=None,
+    updated_by=None,
+)
+
+# 6MB payload, one byte-string shared by every run (exceeds the 5MB limit below)
+_TOO_LARGE = b"x" * (6 * 1024 * 1024)
 
 
 @pytest.fixture
@@ -37,6 +47,9 @@ def mock_uow():
     """Create mock UnitOfWork."""
     uow = Mock()
     uow.products = Mock()
+    uow.products.get_by_id = AsyncMock()
+    uow.products.get_images_for_product = AsyncMock()
+    uow.products.save_image = AsyncMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
     uow.__aexit__ = AsyncMock()
     uow.commit = AsyncMock()
@@ -90,29 +103,17 @@ def use_case(mock_uow, mock_file_storage, mock_clock, mock_audit_log, mock_cache
 
 
 @pytest.mark.asyncio
-async def test_upload_image_success(use_case, mock_uow, mock_file_storage, mock_audit_log):
+async def test_upload_image_success(
+    use_case, mock_uow, mock_file_storage, mock_audit_log, png_bytes
+):
     """Test successful image upload."""
     product_id = uuid.uuid4()
     user_id = uuid.uuid4()
     
     # Mock product exists
-    product = Product(
-        id=product_id,
-        name="Test Product",
-        slug=Slug("test-product"),
-        status=ProductStatus.DRAFT,
-        description_short=None,
-        description_long=None,
-        tags=[],
-        featured=False,
-        sort_order=0,
-        created_at=datetime(2024, 1, 1),
-        updated_at=datetime(2024, 1, 1),
-        created_by=user_id,
-        updated_by=None,
-    )
-    mock_uow.products.get_by_id = AsyncMock(return_value=product)
-    mock_uow.products.get_images_for_product = AsyncMock(return_value=[])
+    product = replace(_PRODUCT, id=product_id, created_by=user_id)
+    mock_uow.products.get_by_id.return_value = product
+    mock_uow.products.get_images_for_product.return_value = []
     
     # Mock file storage upload
     upload_result = ImageUploadResult(
@@ -123,18 +124,15 @@ async def test_upload_image_success(use_case, mock_uow, mock_file_storage, mock_
         height=600,
         format="jpg",
     )
-    mock_file_storage.upload_image = AsyncMock(return_value=upload_result)
+    mock_file_storage.upload_image.return_value = upload_result
     
     # Mock save image
-    mock_uow.products.save_image = AsyncMock(
-        side_effect=lambda img: img  # Return the same image
-    )
+    mock_uow.products.save_image.side_effect = lambda img: img  # Return the same image
     
     # Create request
-    image_bytes = create_test_image_bytes()
     request = UploadProductImageRequest(
         product_id=product_id,
-        file_data=image_bytes,
+        file_data=png_bytes,
         filename="test.png",
         content_type="image/png",
         alt_text="Test image",
@@ -162,18 +160,17 @@ async def test_upload_image_success(use_case, mock_uow, mock_file_storage, mock_
 
 
 @pytest.mark.asyncio
-async def test_upload_image_product_not_found(use_case, mock_uow):
+async def test_upload_image_product_not_found(use_case, mock_uow, png_bytes):
     """Test upload fails when product doesn't exist."""
     product_id = uuid.uuid4()
     
     # Mock product not found
-    mock_uow.products.get_by_id = AsyncMock(return_value=None)
+    mock_uow.products.get_by_id.return_value = None
     
     # Create request
-    image_bytes = create_test_image_bytes()
     request = UploadProductImageRequest(
         product_id=product_id,
-        file_data=image_bytes,
+        file_data=png_bytes,
         filename="test.png",
         content_type="image/png",
         alt_text="Test image",
@@ -203,10 +200,8 @@ async def test_upload_image_invalid_content_type(use_case, mock_uow):
     )
     
     # Execute and assert
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match="Invalid image format"):
         await use_case.execute(request)
-    
-    assert "Invalid image format" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
@@ -215,10 +210,9 @@ async def test_upload_image_file_too_large(use_case, mock_uow):
     product_id = uuid.uuid4()
     
     # Create request with file larger than max
-    large_data = b"x" * (6 * 1024 * 1024)  # 6MB (exceeds 5MB limit)
     request = UploadProductImageRequest(
         product_id=product_id,
-        file_data=large_data,
+        file_data=_TOO_LARGE,
         filename="test.png",
         content_type="image/png",
         alt_text=None,
@@ -227,10 +221,8 @@ async def test_upload_image_file_too_large(use_case, mock_uow):
     )
     
     # Execute and assert
-    with pytest.raises(ValidationError) as exc_info:
+    with pytest.raises(ValidationError, match="exceeds maximum"):
         await use_case.execute(request)
-    
-    assert "exceeds maximum" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
@@ -240,22 +232,8 @@ async def test_upload_image_corrupted_file(use_case, mock_uow):
     user_id = uuid.uuid4()
     
     # Mock product exists
-    product = Product(
-        id=product_id,
-        name="Test Product",
-        slug=Slug("test-product"),
-        status=ProductStatus.DRAFT,
-        description_short=None,
-        description_long=None,
-        tags=[],
-        featured=False,
-        sort_order=0,
-        created_at=datetime(2024, 1, 1),
-        updated_at=datetime(2024, 1, 1),
-        created_by=user_id,
-        updated_by=None,
-    )
-    mock_uow.products.get_by_id = AsyncMock(return_value=product)
+    product = replace(_PRODUCT, id=product_id, created_by=user_id)
+    mock_uow.products.get_by_id.return_value = product
     
     # Create request with corrupted PNG data
     corrupted_data = b"fake png data"